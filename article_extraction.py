@@ -0,0 +1,14 @@
+"""
+Article Extraction
+Newspaper3k parsing for the CSE content extractor (test.py), kept in an
+importable module so spawned worker processes can run it
+"""
+
+from newspaper import Article
+
+
+def extract_article_text(url, html):
+    article = Article(url)
+    article.set_html(html)
+    article.parse()
+    return article.title, article.text
@@ -4,17 +4,79 @@ Central API gateway that routes requests to appropriate language nodes
 """
 
 import asyncio
+import copy
+import gzip
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+import sys
+import time
+import zlib
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 import requests
 import uvicorn
 
+# Backend packages (core, language_nodes) are imported as top-level packages
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from core.result_cache import ResultCache
+
+try:
+    import uvloop  # noqa: F401 - libuv event loop for uvicorn
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import rloop
+    RLOOP_AVAILABLE = True
+except ImportError:
+    RLOOP_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401 - C HTTP parser for uvicorn
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# API_EVENT_LOOP=rloop opts into the Rust rloop event loop when installed.
+# The policy is set at import so reload and worker subprocesses, which
+# import this module rather than run it, use the same loop.
+USE_RLOOP = os.getenv("API_EVENT_LOOP", "auto").lower() == "rloop" and RLOOP_AVAILABLE
+if USE_RLOOP:
+    asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,7 +84,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="GlobalMind FL API Gateway",
     description="Federated Learning for Multilingual AI Search Intelligence",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the Unicode-heavy responses far faster than json
+    default_response_class=DEFAULT_RESPONSE_CLASS
 )
 
 # Enable CORS for frontend communication
@@ -34,6 +98,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger dynamic responses at a level that is cheap per request;
+# static catalogs arrive precompressed
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=6)
+
 # Language node endpoints
 LANGUAGE_NODES = {
     "hindi": "http://localhost:8001",
@@ -50,6 +118,50 @@ LANGUAGE_PATTERNS = {
     "english": ["hello", "thank", "please", "how", "what", "where", "when", "cricket", "india"]
 }
 
+# Keyword count per language, the denominator of the detection confidence
+LANGUAGE_PATTERN_COUNTS = {language: len(keywords) for language, keywords in LANGUAGE_PATTERNS.items()}
+
+def _build_language_automaton():
+    """Compile every language keyword into one Aho-Corasick automaton whose
+    payloads are the (language, keyword) pairs registered for that keyword"""
+    automaton = ahocorasick.Automaton()
+    payloads = {}
+    for language, keywords in LANGUAGE_PATTERNS.items():
+        for keyword in keywords:
+            payloads.setdefault(keyword, []).append((language, keyword))
+    for keyword, pairs in payloads.items():
+        automaton.add_word(keyword, tuple(pairs))
+    automaton.make_automaton()
+    return automaton
+
+LANGUAGE_AUTOMATON = _build_language_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _matched_language_keywords(query: str) -> set:
+    """(language, keyword) pairs for every pattern keyword found in query"""
+    if LANGUAGE_AUTOMATON is None:
+        return {
+            (language, keyword)
+            for language, keywords in LANGUAGE_PATTERNS.items()
+            for keyword in keywords if keyword in query
+        }
+    return {pair for _, pairs in LANGUAGE_AUTOMATON.iter(query) for pair in pairs}
+
+# (monotonic_ns, ISO string) of the last timestamp handed out by _cached_iso_now
+_iso_now_cache = (None, "")
+
+def _cached_iso_now(ttl_ns: int = 10**9) -> str:
+    """Current local time in ISO format, reused for up to ttl_ns nanoseconds.
+    
+    For status endpoints whose timestamps tolerate a second of staleness.
+    """
+    global _iso_now_cache
+    now_ns = time.monotonic_ns()
+    last_ns, last_iso = _iso_now_cache
+    if last_ns is None or now_ns - last_ns >= ttl_ns:
+        last_iso = datetime.now().isoformat()
+        _iso_now_cache = (now_ns, last_iso)
+    return last_iso
+
 class QueryRequest(BaseModel):
     query: str
     language: Optional[str] = None
@@ -75,43 +187,106 @@ class SummarizerConfigRequest(BaseModel):
     min_results_threshold: Optional[int] = None
     min_content_length: Optional[int] = None
 
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize payload exactly as the default response class renders it"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+class StaticJSON:
+    """
+    Pre-serialized JSON body kept alongside its compressed encodings, so
+    serving it costs no serialization or compression per request
+    """
+    
+    __slots__ = ("content", "encoded")
+    
+    def __init__(self, content: bytes, encoded: Optional[Dict[str, bytes]] = None):
+        self.content = content
+        # In order of preference
+        if encoded is None:
+            encoded = {}
+            if BROTLI_AVAILABLE:
+                encoded["br"] = brotli.compress(content, quality=11)
+            encoded["gzip"] = gzip.compress(content, compresslevel=9)
+        self.encoded = encoded
+        
+    def response(self, request: Request) -> Response:
+        """Serve the best encoding the client accepts"""
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding, body in self.encoded.items():
+            if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return Response(
+                    content=body,
+                    media_type="application/json",
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+                )
+        return Response(content=self.content, media_type="application/json")
+
+# Static catalogs are serialized and compressed once at import
+_ROOT_JSON = StaticJSON(_encode_json({
+    "name": "GlobalMind FL API Gateway",
+    "version": "1.0.0",
+    "description": "Federated Learning for Multilingual AI Search Intelligence",
+    "supported_languages": list(LANGUAGE_NODES.keys()),
+    "endpoints": {
+        "query": "/api/v1/query",
+        "health": "/health",
+        "language_detection": "/api/v1/detect-language",
+        "federation_status": "/api/v1/federation/status"
+    }
+}))
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint with API information"""
-    return {
-        "name": "GlobalMind FL API Gateway",
-        "version": "1.0.0",
-        "description": "Federated Learning for Multilingual AI Search Intelligence",
-        "supported_languages": list(LANGUAGE_NODES.keys()),
-        "endpoints": {
-            "query": "/api/v1/query",
-            "health": "/health",
-            "language_detection": "/api/v1/detect-language",
-            "federation_status": "/api/v1/federation/status"
+    return _ROOT_JSON.response(request)
+
+async def _probe_node(language: str, endpoint: str, checked_at: str) -> Tuple[str, Dict[str, Any]]:
+    """Check one language node's availability"""
+    try:
+        # In MVP, we simulate health checks
+        # In production, this would be an actual HTTP request
+        return language, {
+            "status": "healthy",
+            "endpoint": endpoint,
+            "last_check": checked_at
+        }
+    except Exception as e:
+        return language, {
+            "status": "unhealthy",
+            "endpoint": endpoint,
+            "error": str(e),
+            "last_check": checked_at
         }
-    }
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    # Check language node availability
-    node_health = {}
-    for language, endpoint in LANGUAGE_NODES.items():
-        try:
-            # In MVP, we simulate health checks
-            # In production, this would be actual HTTP requests
-            node_health[language] = {
-                "status": "healthy",
-                "endpoint": endpoint,
-                "last_check": datetime.now().isoformat()
-            }
-        except Exception as e:
-            node_health[language] = {
-                "status": "unhealthy",
-                "endpoint": endpoint,
-                "error": str(e),
-                "last_check": datetime.now().isoformat()
-            }
+    # Check language node availability, all nodes probed concurrently
+    now = _cached_iso_now()
+    node_health = dict(await asyncio.gather(
+        *(_probe_node(language, endpoint, now) for language, endpoint in LANGUAGE_NODES.items())
+    ))
     
     overall_health = "healthy" if all(
         node["status"] == "healthy" for node in node_health.values()
@@ -119,52 +294,83 @@ async def health_check():
     
     return {
         "status": overall_health,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now,
         "nodes": node_health,
         "version": "1.0.0"
     }
 
-@app.post("/api/v1/detect-language")
-async def detect_language(request: QueryRequest):
-    """Detect language of the input query"""
-    query = request.query.lower()
-    
-    # Simple keyword-based language detection for MVP
+@dataclass(frozen=True, slots=True)
+class DetectionResult:
+    """Outcome of keyword-based language detection"""
+    language: str
+    confidence: float
+    scores: Tuple[Tuple[str, int], ...]
+
+def _detect(query: str) -> DetectionResult:
+    """Detect the language of a query"""
+    return _score_language(query.lower())
+
+@lru_cache(maxsize=4096)
+def _score_language(query: str) -> DetectionResult:
+    """Keyword-based language detection for a lowercased query. Memoized,
+    since LANGUAGE_PATTERNS never changes at runtime"""
+    # Simple keyword-based language detection for MVP: one scan of the
+    # query finds every keyword, each counted once per language
+    matched = _matched_language_keywords(query)
     language_scores = {}
     
-    for language, keywords in LANGUAGE_PATTERNS.items():
-        score = sum(1 for keyword in keywords if keyword in query)
+    for language in LANGUAGE_PATTERNS:
+        score = sum(1 for matched_language, _ in matched if matched_language == language)
         if score > 0:
             language_scores[language] = score
     
     if language_scores:
         detected_language = max(language_scores, key=language_scores.get)
-        confidence = language_scores[detected_language] / len(LANGUAGE_PATTERNS[detected_language])
+        confidence = language_scores[detected_language] / LANGUAGE_PATTERN_COUNTS[detected_language]
     else:
         # Default fallback - could be enhanced with actual language detection
         detected_language = "english"  # Default to English for MVP
         confidence = 0.5
+        
+    return DetectionResult(detected_language, confidence, tuple(language_scores.items()))
+
+@app.post("/api/v1/detect-language")
+async def detect_language(request: QueryRequest):
+    """Detect language of the input query"""
+    detection = _detect(request.query)
     
     return {
         "query": request.query,
-        "detected_language": detected_language,
-        "confidence": round(confidence, 2),
-        "all_scores": language_scores,
+        "detected_language": detection.language,
+        "confidence": round(detection.confidence, 2),
+        "all_scores": dict(detection.scores),
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.post("/api/v1/debug/detect-language/cache-clear")
+async def clear_language_detection_cache():
+    """Drop memoized language detections and report the cache statistics"""
+    info = _score_language.cache_info()
+    _score_language.cache_clear()
+    return {
+        "cleared": info.currsize,
+        "hits": info.hits,
+        "misses": info.misses,
         "timestamp": datetime.now().isoformat()
     }
 
 @app.post("/api/v1/query", response_model=QueryResponse)
 async def process_query(request: QueryRequest):
     """Process multilingual query and route to appropriate language node"""
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
+    timestamp = datetime.now().isoformat()
     
     try:
         # Language detection
         if request.language:
             detected_language = request.language
         else:
-            detection_result = await detect_language(request)
-            detected_language = detection_result["detected_language"]
+            detected_language = _detect(request.query).language
         
         # Validate language support
         if detected_language not in LANGUAGE_NODES:
@@ -181,16 +387,18 @@ async def process_query(request: QueryRequest):
         node_response = await actual_node_processing(detected_language, request.query, request.context)
         
         # Calculate processing time
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
-        
-        return QueryResponse(
-            query=request.query,
-            detected_language=detected_language,
-            response=node_response,
-            processing_time_ms=round(processing_time, 2),
-            timestamp=start_time.isoformat(),
-            node_endpoint=node_endpoint
-        )
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        # Returned as a ready response so FastAPI does not re-validate what
+        # was built here; response_model still documents the schema
+        return DEFAULT_RESPONSE_CLASS({
+            "query": request.query,
+            "detected_language": detected_language,
+            "response": node_response,
+            "processing_time_ms": round(processing_time, 2),
+            "timestamp": timestamp,
+            "node_endpoint": node_endpoint
+        })
         
     except HTTPException:
         raise
@@ -198,25 +406,72 @@ async def process_query(request: QueryRequest):
         logger.error(f"Error processing query: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+def real_world_aggregator():
+    """Return the process-wide RealWorldDataAggregator.
+    
+    core is imported as a top-level package, so the gateway and the
+    language nodes share the same aggregator and HTTP connection pool.
+    """
+    from core.real_world_data import get_real_world_aggregator
+    return get_real_world_aggregator()
+
+@app.on_event("startup")
+async def start_real_world_client():
+    """Create the shared aggregator before the first query arrives"""
+    app.state.real_world = real_world_aggregator()
+
+@app.on_event("shutdown")
+async def close_real_world_client():
+    """Close the pooled connections of the shared aggregator"""
+    await real_world_aggregator().google_cse.aclose()
+
+# Node responses for recently seen (language, query) pairs, and the node
+# requests currently in flight
+NODE_RESPONSE_CACHE = ResultCache(capacity=2048, ttl=900)
+_node_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
 async def actual_node_processing(language: str, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
-    """Actual language node processing with real Google Custom Search"""
+    """Actual language node processing with real Google Custom Search.
     
-    # Import real-world data integration
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    Responses are cached per (language, query) for 15 minutes, and
+    concurrent identical misses share a single request. Each caller gets
+    its own copy, stamped with its own timestamp and response time.
+    """
+    start_ns = time.perf_counter_ns()
+    key = (language, query)
+    shared = NODE_RESPONSE_CACHE.get(key)
+    if shared is None:
+        task = _node_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_process_and_cache(key, context))
+            _node_inflight[key] = task
+            task.add_done_callback(lambda _: _node_inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared request
+        shared = await asyncio.shield(task)
+        
+    result = copy.deepcopy(shared)
+    result["response_time_ms"] = round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+    result["timestamp"] = datetime.now().isoformat()
+    return result
+
+async def _process_and_cache(key: Tuple[str, str], context: Optional[Dict]) -> Dict[str, Any]:
+    """Process a query and cache the response unless it is the error fallback"""
+    result = await _process_with_real_world_data(*key, context)
+    if result.get("real_world_data") is not None:
+        NODE_RESPONSE_CACHE.put(key, result)
+    return result
+
+async def _process_with_real_world_data(language: str, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    """Generate a language response from freshly fetched real-world data"""
     
     try:
-        from core.real_world_data import GoogleCSEIntegration, RealWorldDataAggregator
-        
-        # Initialize Google CSE
-        google_cse = GoogleCSEIntegration()
-        aggregator = RealWorldDataAggregator(google_cse)
+        # Shared aggregator: one pooled keep-alive HTTP client for all queries
+        aggregator = real_world_aggregator()
         
         logger.info(f"🔍 Fetching real-world data for: {query} in {language}")
         
         # Get actual real-world data
-        real_world_data = aggregator.get_real_world_context(query, language, {})
+        real_world_data = await aggregator.async_get_real_world_context(query, language, {})
         
         logger.info(f"✅ Found {len(real_world_data.get('search_results', []))} real results")
         
@@ -250,36 +505,12 @@ async def actual_node_processing(language: str, query: str, context: Optional[Di
             "real_world_data": None
         }
 
-async def generate_real_hindi_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
-    """Generate Hindi response with real Google search results"""
-    
-    # Extract real information from Google search results
-    search_results = real_world_data.get('search_results', [])
-    has_real_data = len(search_results) > 0
-    
-    if has_real_data:
-        # Use real search results (snippets only for global general search)
-        top_result = search_results[0]
-        real_content = top_result.get('snippet', '')[:500]  # Use snippet only
-        real_sources = [r.get('source', 'Unknown') for r in search_results[:3]]
-        
-        # Check if AI summary is available
-        ai_summary_text = ""
-        if real_world_data.get('ai_summary') and real_world_data['ai_summary'].get('ai_summary'):
-            ai_summary_text = f"\n\n{real_world_data['ai_summary']['ai_summary']}"
-        
-        response_content = f"""
-**वास्तविक जानकारी**: {real_content}
-
-**स्रोत**: {', '.join(real_sources)}{ai_summary_text}
-
-**अतिरिक्त संदर्भ**: इस विषय पर और भी जानकारी उपलब्ध है।
-        """.strip()
-    else:
-        response_content = f"'{query}' के बारे में वर्तमान में विस्तृत जानकारी उपलब्ध नहीं है।"
-    
-    return {
-        "query": query,
+# Invariant parts of the responses built by generate_real_*_response, laid
+# out in response key order with None placeholders for per-query values.
+# Responses share the nested dicts, so treat them as read-only.
+_REAL_RESPONSE_TEMPLATES = {
+    "hindi": {
+        "query": None,
         "language": "hindi",
         "script": {"primary_script": "devanagari", "mixed_script": False},
         "intent": "general_query",
@@ -288,122 +519,90 @@ async def generate_real_hindi_response(query: str, real_world_data: Dict) -> Dic
             "food_items": [],
             "healthcare_topics": []
         },
-        "real_world_data": real_world_data,
-        "response": {
-            "type": "real_world_response",
-            "cultural_introduction": f"आपके प्रश्न '{query}' के बारे में वास्तविक जानकारी:",
-            "main_content": response_content,
-            "practical_advice": "🌐 **वास्तविक डेटा**: यह जानकारी इंटरनेट से प्राप्त की गई है।",
-            "additional_resources": [
-                {
-                    "title": result.get('title', 'No title'),
-                    "link": result.get('link', ''),
-                    "source": result.get('source', 'Unknown'),
-                    "snippet": result.get('snippet', '')[:100] + "..." if result.get('snippet') else ""
-                }
-                for result in search_results[:3]
-            ],
-            "confidence_level": "high" if has_real_data else "low"
-        },
-        "confidence": 0.9 if has_real_data else 0.4,
+        "real_world_data": None,
+        "response": None,
+        "confidence": None,
         "response_time_ms": 150,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": None,
         "node_id": "hindi_node_real_world"
-    }
-
-async def generate_real_telugu_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
-    """Generate Telugu response with real Google search results"""
-    
-    search_results = real_world_data.get('search_results', [])
-    has_real_data = len(search_results) > 0
-    
-    if has_real_data:
-        top_result = search_results[0]
-        real_content = top_result.get('snippet', '')[:500]  # Use snippet only
-        real_sources = [r.get('source', 'Unknown') for r in search_results[:3]]
-        
-        # Check if AI summary is available
-        ai_summary_text = ""
-        if real_world_data.get('ai_summary') and real_world_data['ai_summary'].get('ai_summary'):
-            ai_summary_text = f"\n\n{real_world_data['ai_summary']['ai_summary']}"
-        
-        response_content = f"""
-**వాస్తవ సమాచారం**: {real_content}
-
-**మూలాలు**: {', '.join(real_sources)}{ai_summary_text}
-        """.strip()
-    else:
-        response_content = f"'{query}' గురించి ప్రస్తుతం వివరణాత్మక సమాచారం అందుబాటులో లేదు।"
-    
-    return {
-        "query": query,
+    },
+    "telugu": {
+        "query": None,
         "language": "telugu",
         "script": {"primary_script": "telugu", "mixed_script": False},
         "intent": "general_query",
         "cultural_context": {"festivals": [], "literature": [], "temples": []},
-        "real_world_data": real_world_data,
-        "response": {
-            "type": "real_world_response",
-            "cultural_introduction": f"మీ ప్రశ్న '{query}' గురించి వాస్తవ సమాచారం:",
-            "main_content": response_content,
-            "practical_advice": "🌐 **వాస్తవ డేటా**: ఈ సమాచారం ఇంటర్నెట్ నుండి పొందబడింది।",
-            "confidence_level": "high" if has_real_data else "low"
-        },
-        "confidence": 0.9 if has_real_data else 0.4,
+        "real_world_data": None,
+        "response": None,
+        "confidence": None,
         "response_time_ms": 150,
-        "timestamp": datetime.now().isoformat()
-    }
-
-async def generate_real_marathi_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
-    """Generate Marathi response with real Google search results"""
-    
-    search_results = real_world_data.get('search_results', [])
-    has_real_data = len(search_results) > 0
-    
-    if has_real_data:
-        top_result = search_results[0]
-        real_content = top_result.get('snippet', '')[:500]  # Use snippet only
-        real_sources = [r.get('source', 'Unknown') for r in search_results[:3]]
-        
-        # Check if AI summary is available
-        ai_summary_text = ""
-        if real_world_data.get('ai_summary') and real_world_data['ai_summary'].get('ai_summary'):
-            ai_summary_text = f"\n\n{real_world_data['ai_summary']['ai_summary']}"
-        
-        response_content = f"""
-**वास्तविक माहिती**: {real_content}
-
-**स्रोत**: {', '.join(real_sources)}{ai_summary_text}
-        """.strip()
-    else:
-        response_content = f"'{query}' बद्दल सध्या तपशीलवार माहिती उपलब्ध नाही।"
-    
-    return {
-        "query": query,
+        "timestamp": None
+    },
+    "marathi": {
+        "query": None,
         "language": "marathi",
         "script": {"primary_script": "devanagari", "mixed_script": False},
         "intent": "general_query",
         "cultural_context": {"festivals": [], "business": [], "arts": []},
-        "real_world_data": real_world_data,
-        "response": {
-            "type": "real_world_response",
-            "cultural_introduction": f"तुमच्या प्रश्न '{query}' बद्दल वास्तविक माहिती:",
-            "main_content": response_content,
-            "practical_advice": "🌐 **वास्तविक डेटा**: ही माहिती इंटरनेटवरून मिळवली आहे।",
-            "confidence_level": "high" if has_real_data else "low"
-        },
-        "confidence": 0.9 if has_real_data else 0.4,
+        "real_world_data": None,
+        "response": None,
+        "confidence": None,
         "response_time_ms": 150,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": None
+    },
+    "english": {
+        "query": None,
+        "language": "english",
+        "script": {"primary_script": "latin", "mixed_script": False},
+        "intent": "general_query",
+        "cultural_context": {"festivals": [], "business": [], "technology": []},
+        "real_world_data": None,
+        "response": None,
+        "confidence": None,
+        "response_time_ms": 150,
+        "timestamp": None
     }
+}
 
-async def generate_real_english_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
-    """Generate English response with real Google search results"""
+# Localized response text; str.format templates filled per query
+_REAL_RESPONSE_TEXT = {
+    "hindi": {
+        "content": "**वास्तविक जानकारी**: {content}\n\n**स्रोत**: {sources}{ai_summary}\n\n**अतिरिक्त संदर्भ**: इस विषय पर और भी जानकारी उपलब्ध है।",
+        "no_content": "'{query}' के बारे में वर्तमान में विस्तृत जानकारी उपलब्ध नहीं है।",
+        "introduction": "आपके प्रश्न '{query}' के बारे में वास्तविक जानकारी:",
+        "advice": "🌐 **वास्तविक डेटा**: यह जानकारी इंटरनेट से प्राप्त की गई है।"
+    },
+    "telugu": {
+        "content": "**వాస్తవ సమాచారం**: {content}\n\n**మూలాలు**: {sources}{ai_summary}",
+        "no_content": "'{query}' గురించి ప్రస్తుతం వివరణాత్మక సమాచారం అందుబాటులో లేదు।",
+        "introduction": "మీ ప్రశ్న '{query}' గురించి వాస్తవ సమాచారం:",
+        "advice": "🌐 **వాస్తవ డేటా**: ఈ సమాచారం ఇంటర్నెట్ నుండి పొందబడింది।"
+    },
+    "marathi": {
+        "content": "**वास्तविक माहिती**: {content}\n\n**स्रोत**: {sources}{ai_summary}",
+        "no_content": "'{query}' बद्दल सध्या तपशीलवार माहिती उपलब्ध नाही।",
+        "introduction": "तुमच्या प्रश्न '{query}' बद्दल वास्तविक माहिती:",
+        "advice": "🌐 **वास्तविक डेटा**: ही माहिती इंटरनेटवरून मिळवली आहे।"
+    },
+    "english": {
+        "content": "**Real Information**: {content}\n\n**Sources**: {sources}{ai_summary}",
+        "no_content": "'{query}' - Detailed information is currently not available.",
+        "introduction": "Real-world information about '{query}':",
+        "advice": "🌐 **Live Data**: This information was retrieved from the internet."
+    }
+}
+
+def _build_real_response(language: str, query: str, real_world_data: Dict,
+                         include_resources: bool = False) -> Dict[str, Any]:
+    """Fill a language's response template with real Google search results"""
+    text = _REAL_RESPONSE_TEXT[language]
     
+    # Extract real information from Google search results
     search_results = real_world_data.get('search_results', [])
     has_real_data = len(search_results) > 0
     
     if has_real_data:
+        # Use real search results (snippets only for global general search)
         top_result = search_results[0]
         real_content = top_result.get('snippet', '')[:500]  # Use snippet only
         real_sources = [r.get('source', 'Unknown') for r in search_results[:3]]
@@ -412,33 +611,54 @@ async def generate_real_english_response(query: str, real_world_data: Dict) -> D
         ai_summary_text = ""
         if real_world_data.get('ai_summary') and real_world_data['ai_summary'].get('ai_summary'):
             ai_summary_text = f"\n\n{real_world_data['ai_summary']['ai_summary']}"
-        
-        response_content = f"""
-**Real Information**: {real_content}
-
-**Sources**: {', '.join(real_sources)}{ai_summary_text}
-        """.strip()
+            
+        response_content = text["content"].format(
+            content=real_content, sources=', '.join(real_sources), ai_summary=ai_summary_text
+        ).strip()
     else:
-        response_content = f"'{query}' - Detailed information is currently not available."
-    
-    return {
-        "query": query,
-        "language": "english",
-        "script": {"primary_script": "latin", "mixed_script": False},
-        "intent": "general_query",
-        "cultural_context": {"festivals": [], "business": [], "technology": []},
-        "real_world_data": real_world_data,
-        "response": {
-            "type": "real_world_response",
-            "cultural_introduction": f"Real-world information about '{query}':",
-            "main_content": response_content,
-            "practical_advice": "🌐 **Live Data**: This information was retrieved from the internet.",
-            "confidence_level": "high" if has_real_data else "low"
-        },
-        "confidence": 0.9 if has_real_data else 0.4,
-        "response_time_ms": 150,
-        "timestamp": datetime.now().isoformat()
+        response_content = text["no_content"].format(query=query)
+        
+    response = {
+        "type": "real_world_response",
+        "cultural_introduction": text["introduction"].format(query=query),
+        "main_content": response_content,
+        "practical_advice": text["advice"]
     }
+    if include_resources:
+        response["additional_resources"] = [
+            {
+                "title": result.get('title', 'No title'),
+                "link": result.get('link', ''),
+                "source": result.get('source', 'Unknown'),
+                "snippet": result.get('snippet', '')[:100] + "..." if result.get('snippet') else ""
+            }
+            for result in search_results[:3]
+        ]
+    response["confidence_level"] = "high" if has_real_data else "low"
+    
+    result = _REAL_RESPONSE_TEMPLATES[language].copy()
+    result["query"] = query
+    result["real_world_data"] = real_world_data
+    result["response"] = response
+    result["confidence"] = 0.9 if has_real_data else 0.4
+    result["timestamp"] = datetime.now().isoformat()
+    return result
+
+async def generate_real_hindi_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
+    """Generate Hindi response with real Google search results"""
+    return _build_real_response("hindi", query, real_world_data, include_resources=True)
+
+async def generate_real_telugu_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
+    """Generate Telugu response with real Google search results"""
+    return _build_real_response("telugu", query, real_world_data)
+
+async def generate_real_marathi_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
+    """Generate Marathi response with real Google search results"""
+    return _build_real_response("marathi", query, real_world_data)
+
+async def generate_real_english_response(query: str, real_world_data: Dict) -> Dict[str, Any]:
+    """Generate English response with real Google search results"""
+    return _build_real_response("english", query, real_world_data)
 
 @app.get("/api/v1/federation/status")
 async def get_federation_status():
@@ -448,7 +668,7 @@ async def get_federation_status():
         "federation_active": True,
         "participating_nodes": list(LANGUAGE_NODES.keys()),
         "current_round": 1,
-        "last_update": datetime.now().isoformat(),
+        "last_update": _cached_iso_now(),
         "global_model_version": "1.0.0",
         "performance_metrics": {
             "average_accuracy": 0.85,
@@ -458,87 +678,124 @@ async def get_federation_status():
         }
     }
 
+# Supported languages with their scripts, regions and cultural domains
+SUPPORTED_LANGUAGES = {
+    "hindi": {
+        "code": "hi",
+        "name": "Hindi",
+        "script": "Devanagari",
+        "speakers": "600M+",
+        "regions": ["North India", "Central India"],
+        "cultural_domains": ["festivals", "food", "healthcare", "education", "government"]
+    },
+    "telugu": {
+        "code": "te", 
+        "name": "Telugu",
+        "script": "Telugu Script",
+        "speakers": "95M+",
+        "regions": ["Andhra Pradesh", "Telangana"],
+        "cultural_domains": ["festivals", "literature", "agriculture", "temples", "arts"]
+    },
+    "marathi": {
+        "code": "mr",
+        "name": "Marathi", 
+        "script": "Devanagari",
+        "speakers": "95M+",
+        "regions": ["Maharashtra", "Goa"],
+        "cultural_domains": ["festivals", "business", "arts", "history", "literature"]
+    },
+    "english": {
+        "code": "en",
+        "name": "English",
+        "script": "Latin",
+        "speakers": "300M+ (India)",
+        "regions": ["All India", "Urban Areas", "Business"],
+        "cultural_domains": ["business", "technology", "education", "government", "global"]
+    }
+}
+
+# Languages catalog serialized up to the opening quote of its trailing
+# "last_updated" value; each response appends the current timestamp
+_LANGUAGES_JSON_PREFIX = _encode_json({
+    "supported_languages": SUPPORTED_LANGUAGES,
+    "total_languages": len(SUPPORTED_LANGUAGES),
+    "total_speakers": "1090M+",
+    "last_updated": ""
+})[:-2]
+
+# Gzip stream with the static prefix already compressed; copies of the
+# compressor only have to deflate the timestamp tail
+_LANGUAGES_GZIP = zlib.compressobj(9, zlib.DEFLATED, 31)
+_LANGUAGES_GZIP_HEAD = _LANGUAGES_GZIP.compress(_LANGUAGES_JSON_PREFIX)
+
+# Brotli cannot resume a compressed prefix, so the whole body is
+# recompressed at a fast quality whenever the timestamp changes
+_LANGUAGES_BROTLI_QUALITY = 4
+
+# Serialized catalog for the current last_updated value, as (timestamp, body)
+_languages_json = (None, None)
+
+def _languages_body(now: str) -> StaticJSON:
+    """Languages catalog stamped with now, in every served encoding"""
+    tail = now.encode() + b'"}'
+    content = _LANGUAGES_JSON_PREFIX + tail
+    encoded = {}
+    if BROTLI_AVAILABLE:
+        encoded["br"] = brotli.compress(content, quality=_LANGUAGES_BROTLI_QUALITY)
+    compressor = _LANGUAGES_GZIP.copy()
+    encoded["gzip"] = _LANGUAGES_GZIP_HEAD + compressor.compress(tail) + compressor.flush()
+    return StaticJSON(content, encoded)
+
 @app.get("/api/v1/languages")
-async def get_supported_languages():
+async def get_supported_languages(request: Request):
     """Get list of supported languages with details"""
-    languages = {
-        "hindi": {
-            "code": "hi",
-            "name": "Hindi",
-            "script": "Devanagari",
-            "speakers": "600M+",
-            "regions": ["North India", "Central India"],
-            "cultural_domains": ["festivals", "food", "healthcare", "education", "government"]
-        },
-        "telugu": {
-            "code": "te", 
-            "name": "Telugu",
-            "script": "Telugu Script",
-            "speakers": "95M+",
-            "regions": ["Andhra Pradesh", "Telangana"],
-            "cultural_domains": ["festivals", "literature", "agriculture", "temples", "arts"]
-        },
-        "marathi": {
-            "code": "mr",
-            "name": "Marathi", 
-            "script": "Devanagari",
-            "speakers": "95M+",
-            "regions": ["Maharashtra", "Goa"],
-            "cultural_domains": ["festivals", "business", "arts", "history", "literature"]
-        },
-        "english": {
-            "code": "en",
-            "name": "English",
-            "script": "Latin",
-            "speakers": "300M+ (India)",
-            "regions": ["All India", "Urban Areas", "Business"],
-            "cultural_domains": ["business", "technology", "education", "government", "global"]
-        }
-    }
-    
-    return {
-        "supported_languages": languages,
-        "total_languages": len(languages),
-        "total_speakers": "1090M+",
-        "last_updated": datetime.now().isoformat()
-    }
+    global _languages_json
+    timestamp, body = _languages_json
+    now = _cached_iso_now()
+    if timestamp != now:
+        # Re-encoded at most once per second, when the cached timestamp ticks
+        body = _languages_body(now)
+        _languages_json = (now, body)
+    return body.response(request)
 
 # Example queries endpoint for testing
+EXAMPLE_QUERIES = {
+    "hindi": [
+        "दिवाली की सफाई कैसे करें?",
+        "होली के रंग कैसे बनाएं?",
+        "बुखार के लिए घरेलू नुस्खे क्या हैं?",
+        "प्रधानमंत्री आवास योजना कैसे apply करें?"
+    ],
+    "telugu": [
+        "ఉగాది పండుగ ఎలా జరుపుకోవాలి?",
+        "దసరా గోలు ఎలా అలంకరించాలి?",
+        "సాంప్రదాయిక తెలుగు వంటకాలు ఏవి?",
+        "తిరుమల దర్శనం కోసం ఎలా బుక్ చేయాలి?"
+    ],
+    "marathi": [
+        "गणेशचतुर्थी कसे साजरे करावे?",
+        "गुढी पाडवा च्या गुढी कशी बनवावी?",
+        "महाराष्ट्रीयन व्यापार संधी कोणत्या आहेत?",
+        "पुण्यात IT जॉब कसे मिळवावे?"
+    ],
+    "english": [
+        "What are the latest cricket updates?",
+        "How to start a business in India?",
+        "Best tourist places in India",
+        "How to apply for Indian passport?"
+    ]
+}
+
+_EXAMPLES_JSON = StaticJSON(_encode_json({
+    "example_queries": EXAMPLE_QUERIES,
+    "usage": "Use these queries to test the language detection and processing capabilities",
+    "note": "Each query demonstrates cultural context understanding in respective languages. English queries focus on general information and business topics."
+}))
+
 @app.get("/api/v1/examples")
-async def get_example_queries():
+async def get_example_queries(request: Request):
     """Get example queries for each language"""
-    examples = {
-        "hindi": [
-            "दिवाली की सफाई कैसे करें?",
-            "होली के रंग कैसे बनाएं?",
-            "बुखार के लिए घरेलू नुस्खे क्या हैं?",
-            "प्रधानमंत्री आवास योजना कैसे apply करें?"
-        ],
-        "telugu": [
-            "ఉగాది పండుగ ఎలా జరుపుకోవాలి?",
-            "దసరా గోలు ఎలా అలంకరించాలి?",
-            "సాంప్రదాయిక తెలుగు వంటకాలు ఏవి?",
-            "తిరుమల దర్శనం కోసం ఎలా బుక్ చేయాలి?"
-        ],
-        "marathi": [
-            "गणेशचतुर्थी कसे साजरे करावे?",
-            "गुढी पाडवा च्या गुढी कशी बनवावी?",
-            "महाराष्ट्रीयन व्यापार संधी कोणत्या आहेत?",
-            "पुण्यात IT जॉब कसे मिळवावे?"
-        ],
-        "english": [
-            "What are the latest cricket updates?",
-            "How to start a business in India?",
-            "Best tourist places in India",
-            "How to apply for Indian passport?"
-        ]
-    }
-    
-    return {
-        "example_queries": examples,
-        "usage": "Use these queries to test the language detection and processing capabilities",
-        "note": "Each query demonstrates cultural context understanding in respective languages. English queries focus on general information and business topics."
-    }
+    return _EXAMPLES_JSON.response(request)
 
 # New agentic search endpoint
 @app.post("/api/v1/agentic-search")
@@ -761,10 +1018,16 @@ async def benchmark_summarizers(request: SearchRequest):
 
 if __name__ == "__main__":
     logger.info("Starting GlobalMind FL API Gateway...")
+    # Auto-reload for development; set API_RELOAD=false to serve with
+    # several worker processes instead
+    reload = os.getenv("API_RELOAD", "true").lower() != "false"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=None if reload else max(2, (os.cpu_count() or 1) // 2),
+        loop="none" if USE_RLOOP else "uvloop" if UVLOOP_AVAILABLE else "auto",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "auto",
         log_level="info"
     )
@@ -5,12 +5,47 @@ Manages the federated learning process across language nodes
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class GlobalState:
+    """Global model state, updated in place by each federation round"""
+    version: str
+    round: int
+    timestamp: str
+    participating_nodes: List[str]
+    performance_metrics: Dict[str, Any] = field(default_factory=dict)
+    total_samples: int = 0
+    weighted_accuracy: float = 0.0
+    last_node_updates: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form used in federation status; aggregation results are
+        omitted until the first round has completed"""
+        state = {
+            "version": self.version,
+            "round": self.round,
+            "timestamp": self.timestamp,
+            "participating_nodes": self.participating_nodes,
+            "performance_metrics": self.performance_metrics
+        }
+        if self.round:
+            state["total_samples"] = self.total_samples
+            state["weighted_accuracy"] = self.weighted_accuracy
+            state["node_updates"] = self.last_node_updates
+        return state
+
 class FederatedCoordinator:
     """
     Central coordinator for managing federated learning across language nodes
@@ -35,13 +70,12 @@ class FederatedCoordinator:
         logger.info("Initializing GlobalMind FL Federation...")
         
         # Initialize global model state
-        self.global_model_state = {
-            "version": "1.0.0",
-            "round": 0,
-            "timestamp": datetime.now().isoformat(),
-            "participating_nodes": [],
-            "performance_metrics": {}
-        }
+        self.global_model_state = GlobalState(
+            version="1.0.0",
+            round=0,
+            timestamp=datetime.now().isoformat(),
+            participating_nodes=[]
+        )
         
         # Check node availability
         await self._check_node_availability()
@@ -50,20 +84,26 @@ class FederatedCoordinator:
         
     async def _check_node_availability(self):
         """Check if all language nodes are available"""
-        available_nodes = []
-        
-        for language, endpoint in self.node_endpoints.items():
-            try:
-                # In MVP, we'll simulate this check
-                # In production, this would be actual HTTP health checks
-                available_nodes.append(language)
-                logger.info(f"{language.title()} node available at {endpoint}")
-            except Exception as e:
-                logger.warning(f"{language.title()} node unavailable: {e}")
+        # Probe all nodes concurrently; results keep node_endpoints order
+        results = await asyncio.gather(
+            *(self._probe_node(language, endpoint) for language, endpoint in self.node_endpoints.items())
+        )
+        available_nodes = [language for language, available in results if available]
                 
-        self.global_model_state["participating_nodes"] = available_nodes
+        self.global_model_state.participating_nodes = available_nodes
         return available_nodes
         
+    async def _probe_node(self, language: str, endpoint: str) -> Tuple[str, bool]:
+        """Check whether one language node is available"""
+        try:
+            # In MVP, we'll simulate this check
+            # In production, this would be actual HTTP health checks
+            logger.info(f"{language.title()} node available at {endpoint}")
+            return language, True
+        except Exception as e:
+            logger.warning(f"{language.title()} node unavailable: {e}")
+            return language, False
+        
     async def start_federated_round(self) -> Dict[str, Any]:
         """Execute one round of federated learning"""
         if self.is_training:
@@ -81,13 +121,10 @@ class FederatedCoordinator:
             # 2. Collect local updates from nodes
             local_updates = await self._collect_local_updates()
             
-            # 3. Aggregate updates (simplified for MVP)
-            new_global_state = await self._aggregate_updates(local_updates)
-            
-            # 4. Update global model
-            self.global_model_state = new_global_state
+            # 3. Aggregate updates into the global model (simplified for MVP)
+            await self._aggregate_updates(local_updates)
             
-            # 5. Evaluate performance
+            # 4. Evaluate performance
             performance = await self._evaluate_global_model()
             
             result = {
@@ -118,47 +155,58 @@ class FederatedCoordinator:
         # MVP: Simulate collecting updates
         logger.info("Collecting local updates from nodes...")
         
-        updates = []
-        for language in self.global_model_state["participating_nodes"]:
-            update = {
-                "node": language,
-                "timestamp": datetime.now().isoformat(),
-                "update_size": 1024,  # Simulated
-                "local_samples": 100,  # Simulated
-                "accuracy": 0.85 + (hash(language) % 10) / 100  # Simulated
-            }
-            updates.append(update)
+        # Request every node's update concurrently
+        updates = await asyncio.gather(
+            *(self._collect_node_update(language) for language in self.global_model_state.participating_nodes)
+        )
             
         await asyncio.sleep(0.2)  # Simulate processing time
-        return updates
+        return list(updates)
         
-    async def _aggregate_updates(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _collect_node_update(self, language: str) -> Dict[str, Any]:
+        """Collect the model update of one language node"""
+        return {
+            "node": language,
+            "timestamp": datetime.now().isoformat(),
+            "update_size": 1024,  # Simulated
+            "local_samples": 100,  # Simulated
+            "accuracy": 0.85 + (hash(language) % 10) / 100  # Simulated
+        }
+        
+    async def _aggregate_updates(self, updates: List[Dict[str, Any]]) -> GlobalState:
         """Aggregate updates from nodes using federated averaging"""
         logger.info("Aggregating updates using FedAvg...")
         
-        # Simple aggregation for MVP
-        total_samples = sum(update["local_samples"] for update in updates)
-        weighted_accuracy = sum(
-            update["accuracy"] * update["local_samples"] 
-            for update in updates
-        ) / total_samples if total_samples > 0 else 0
-        
-        new_state = self.global_model_state.copy()
-        new_state.update({
-            "round": self.federation_round,
-            "timestamp": datetime.now().isoformat(),
-            "total_samples": total_samples,
-            "weighted_accuracy": weighted_accuracy,
-            "node_updates": updates
-        })
-        
-        return new_state
+        # Simple aggregation for MVP; with NumPy the weighted average is one
+        # dot product, the same shape real weight vectors will take as an
+        # (n_nodes, n_params) matrix
+        if NUMPY_AVAILABLE:
+            samples = np.fromiter((update["local_samples"] for update in updates), dtype=np.int64, count=len(updates))
+            accuracies = np.fromiter((update["accuracy"] for update in updates), dtype=np.float64, count=len(updates))
+            total_samples = int(samples.sum())
+            weighted_accuracy = float(accuracies @ samples) / total_samples if total_samples > 0 else 0
+        else:
+            total_samples = sum(update["local_samples"] for update in updates)
+            weighted_accuracy = sum(
+                update["accuracy"] * update["local_samples"] 
+                for update in updates
+            ) / total_samples if total_samples > 0 else 0
+        
+        # Only the per-round fields change; the state is never copied
+        state = self.global_model_state
+        state.round = self.federation_round
+        state.timestamp = datetime.now().isoformat()
+        state.total_samples = total_samples
+        state.weighted_accuracy = weighted_accuracy
+        state.last_node_updates = updates
+        
+        return state
         
     async def _evaluate_global_model(self) -> Dict[str, Any]:
         """Evaluate global model performance"""
         # MVP: Return simulated metrics
         return {
-            "accuracy": self.global_model_state.get("weighted_accuracy", 0.85),
+            "accuracy": self.global_model_state.weighted_accuracy,
             "cultural_relevance": 0.88,  # Simulated
             "response_time": 150,  # ms
             "privacy_preservation": 0.95  # Simulated
@@ -169,7 +217,7 @@ class FederatedCoordinator:
         return {
             "federation_round": self.federation_round,
             "is_training": self.is_training,
-            "global_model_state": self.global_model_state,
+            "global_model_state": self.global_model_state.to_dict() if self.global_model_state else None,
             "node_endpoints": self.node_endpoints
         }
         
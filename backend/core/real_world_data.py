@@ -5,15 +5,41 @@ Focus on general search snippets only (no newspaper content extraction)
 Includes AI-powered summarization capabilities
 """
 
+import asyncio
+import json
 import requests
 import time
+import weakref
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
 import os
 from urllib.parse import urlparse
 
+from .result_cache import ResultCache
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Most blocking searches run in worker threads at once when httpx is
+# missing, so bursts of queries do not exhaust the pool or the CSE quota
+SEARCH_THREAD_LIMIT = 32
+
+# Most real-world contexts kept by an aggregator before the least recently
+# used ones are evicted
+REAL_WORLD_CACHE_SIZE = 2048
+
 class GoogleCSEIntegration:
     """Google Custom Search Engine Integration for real-world data"""
     
@@ -21,13 +47,81 @@ class GoogleCSEIntegration:
         self.api_key = api_key or os.getenv('GOOGLE_CSE_API_KEY', '')
         self.cse_id = cse_id or os.getenv('GOOGLE_CSE_ID', '')
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        self._session = None
+        # asyncio primitives bind to the loop that first uses them, so each
+        # running event loop gets its own client and limiter
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._thread_limiters = weakref.WeakKeyDictionary()
     
     def search_with_language_context(self, query: str, language: str, num_results: int = 5) -> List[Dict]:
         """Search with language and cultural context"""
-        enhanced_query = self._enhance_query_for_language(query, language)
+        params = self._build_search_params(query, language, num_results)
         
-        params = {
-            "q": enhanced_query,
+        try:
+            logger.info(f"Searching for: {params['q']} in {language}")
+            response = self._get_session().get(self.base_url, params=params, timeout=10)
+            return self._handle_search_response(response, language)
+                
+        except Exception as e:
+            logger.error(f"Error in Google CSE search: {e}")
+            return []
+    
+    async def async_search_with_language_context(self, query: str, language: str, num_results: int = 5) -> List[Dict]:
+        """Non-blocking search over a pooled keep-alive connection"""
+        if not HTTPX_AVAILABLE:
+            async with self._get_thread_limiter():
+                return await asyncio.to_thread(self.search_with_language_context, query, language, num_results)
+        
+        params = self._build_search_params(query, language, num_results)
+        
+        try:
+            logger.info(f"Searching for: {params['q']} in {language}")
+            response = await self._get_async_client().get(self.base_url, params=params)
+            return self._handle_search_response(response, language)
+                
+        except Exception as e:
+            logger.error(f"Error in Google CSE search: {e}")
+            return []
+    
+    def _get_thread_limiter(self) -> asyncio.Semaphore:
+        """Lazily create the running loop's semaphore bounding threaded searches"""
+        loop = asyncio.get_running_loop()
+        limiter = self._thread_limiters.get(loop)
+        if limiter is None:
+            limiter = self._thread_limiters[loop] = asyncio.Semaphore(SEARCH_THREAD_LIMIT)
+        return limiter
+    
+    def _get_session(self) -> requests.Session:
+        """Lazily create the keep-alive session used by synchronous searches"""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+    
+    def _get_async_client(self):
+        """Lazily create the running loop's async HTTP client"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return client
+    
+    async def aclose(self):
+        """Close the HTTP session and the running loop's async client"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+    
+    def _build_search_params(self, query: str, language: str, num_results: int) -> Dict:
+        """Build Google CSE request parameters"""
+        return {
+            "q": self._enhance_query_for_language(query, language),
             "key": self.api_key,
             "cx": self.cse_id,
             "num": num_results,
@@ -35,20 +129,14 @@ class GoogleCSEIntegration:
             "gl": "IN",  # Geographic location: India
             "cr": "countryIN"  # Country restriction
         }
-        
-        try:
-            logger.info(f"Searching for: {enhanced_query} in {language}")
-            response = requests.get(self.base_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                results = response.json().get("items", [])
-                return self._process_search_results(results, language)
-            else:
-                logger.error(f"Google CSE API Error: {response.status_code} - {response.text}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error in Google CSE search: {e}")
+    
+    def _handle_search_response(self, response, language: str) -> List[Dict]:
+        """Turn a Google CSE HTTP response into processed results"""
+        if response.status_code == 200:
+            results = response.json().get("items", [])
+            return self._process_search_results(results, language)
+        else:
+            logger.error(f"Google CSE API Error: {response.status_code} - {response.text}")
             return []
     
     def _enhance_query_for_language(self, query: str, language: str) -> str:
@@ -111,26 +199,56 @@ class RealWorldDataAggregator:
     
     def __init__(self, google_cse: GoogleCSEIntegration):
         self.google_cse = google_cse
-        self.cache = {}  # Simple in-memory cache
         self.cache_timeout = 3600  # 1 hour
+        self.cache = ResultCache(REAL_WORLD_CACHE_SIZE, self.cache_timeout)
         self.ai_summarizer = None
         self._initialize_ai_summarizer()
     
     def get_real_world_context(self, query: str, language: str, cultural_context: Dict) -> Dict:
         """Get real-world data with cultural context and AI summarization"""
-        cache_key = f"{query}_{language}"
+        cache_key = self._cache_key(query, language, cultural_context)
         
         # Check cache first
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_timeout:
-                logger.info(f"Returning cached results for: {query}")
-                return cached_data
+        cached_data = self._get_cached(cache_key, query)
+        if cached_data is not None:
+            return cached_data
         
         # Search for real-world information
         logger.info(f"Fetching real-world data for: {query} in {language}")
         search_results = self.google_cse.search_with_language_context(query, language)
         
+        return self._build_context(cache_key, query, language, cultural_context, search_results)
+    
+    async def async_get_real_world_context(self, query: str, language: str, cultural_context: Dict) -> Dict:
+        """Async variant of get_real_world_context that awaits the search"""
+        cache_key = self._cache_key(query, language, cultural_context)
+        
+        cached_data = self._get_cached(cache_key, query)
+        if cached_data is not None:
+            return cached_data
+        
+        logger.info(f"Fetching real-world data for: {query} in {language}")
+        search_results = await self.google_cse.async_search_with_language_context(query, language)
+        
+        return self._build_context(cache_key, query, language, cultural_context, search_results)
+    
+    @staticmethod
+    def _cache_key(query: str, language: str, cultural_context: Dict) -> tuple:
+        """Cache key of a real-world context; the summary depends on the
+        cultural context, so callers passing different contexts for the
+        same query get their own entries"""
+        return (query, language, json.dumps(cultural_context or {}, sort_keys=True, ensure_ascii=False, default=str))
+    
+    def _get_cached(self, cache_key: tuple, query: str) -> Optional[Dict]:
+        """Return a cached result that has not yet timed out"""
+        cached_data = self.cache.get(cache_key)
+        if cached_data is not None:
+            logger.info(f"Returning cached results for: {query}")
+        return cached_data
+    
+    def _build_context(self, cache_key: tuple, query: str, language: str,
+                       cultural_context: Dict, search_results: List[Dict]) -> Dict:
+        """Summarize search results and cache the combined context"""
         # Generate AI-powered summary
         ai_summary_data = self._generate_ai_summary(search_results, query, language)
         
@@ -151,7 +269,7 @@ class RealWorldDataAggregator:
         }
         
         # Cache the result
-        self.cache[cache_key] = (result, time.time())
+        self.cache.put(cache_key, result)
         
         return result
     
@@ -240,3 +358,11 @@ class RealWorldDataAggregator:
         except Exception as e:
             logger.error(f"❌ AI summarization failed: {e}")
             return None
+
+
+@lru_cache(maxsize=1)
+def get_real_world_aggregator() -> RealWorldDataAggregator:
+    """Process-wide aggregator, so all language nodes share one result
+    cache and one pool of HTTP connections. Its HTTP clients are closed by
+    the API gateway's shutdown hook, not by the nodes using it."""
+    return RealWorldDataAggregator(GoogleCSEIntegration())
@@ -0,0 +1,70 @@
+"""
+Result Cache
+Bounded LRU cache with time-to-live expiry for processed node queries
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ResultCache:
+    """
+    LRU cache of query results with a time-to-live.
+
+    Entries are evicted least-recently-used first once the cache holds
+    ``capacity`` items, and are treated as missing once older than
+    ``ttl`` seconds so real-world data does not go stale. Lookups are
+    counted in ``hits`` and ``misses``.
+    """
+
+    def __init__(self, capacity: int = 1024, ttl: float = 300.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Dict[str, Any]):
+        """Store a result, evicting the least recently used entry if full"""
+        if self.capacity <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and lookup counters of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
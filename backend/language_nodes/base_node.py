@@ -4,46 +4,162 @@ Abstract base class for language-specific federated nodes
 """
 
 import asyncio
+import hashlib
 import logging
+import math
+import os
+import sys
+import time
+import unicodedata
 from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
 import json
 
+from .text_utils import warm_up_text_kernels
+
+# core is imported as a top-level package, the way the API gateway does,
+# so all nodes resolve to the same modules
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from core.result_cache import ResultCache
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Prometheus metrics shared by all language nodes, labelled by language code.
+# A dedicated registry keeps re-imports of this module from clashing with
+# collectors registered elsewhere in the process.
+if PROMETHEUS_AVAILABLE:
+    NODE_METRICS_REGISTRY = CollectorRegistry()
+    NODE_QUERIES_TOTAL = Counter(
+        "node_queries_total", "Queries processed by a language node",
+        ["lang"], registry=NODE_METRICS_REGISTRY
+    )
+    NODE_QUERIES_SUCCESS = Counter(
+        "node_queries_success_total", "Queries processed successfully by a language node",
+        ["lang"], registry=NODE_METRICS_REGISTRY
+    )
+    NODE_RESPONSE_SECONDS = Histogram(
+        "node_response_seconds", "Query processing time of a language node",
+        ["lang"], registry=NODE_METRICS_REGISTRY
+    )
+
+# (second, formatted prefix) of the last timestamp formatted by iso_timestamp
+_iso_second_cache = (None, "")
+
+def iso_timestamp(timestamp: float) -> str:
+    """Format a time.time() value like datetime.fromtimestamp(ts).isoformat().
+    
+    The date/time prefix is cached per second, so timestamps taken close
+    together only pay for the microsecond formatting.
+    """
+    global _iso_second_cache
+    fraction, whole = math.modf(timestamp)
+    second, microsecond = int(whole), round(fraction * 1e6)
+    if microsecond >= 1_000_000:
+        second += 1
+        microsecond -= 1_000_000
+        
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_second_cache = (second, prefix)
+        
+    return f"{prefix}.{microsecond:06d}" if microsecond else prefix
+
+def shared_real_world_aggregator():
+    """Return the RealWorldDataAggregator shared by every language node.
+    
+    Imported lazily so nodes load without the real-world dependencies.
+    """
+    from core.real_world_data import get_real_world_aggregator
+    return get_real_world_aggregator()
+
+def normalize_query(query: str) -> str:
+    """NFC form of a query with whitespace runs collapsed.
+    
+    Nodes run detection on this form, so queries sharing a result cache
+    key always produce the same detections.
+    """
+    return " ".join(unicodedata.normalize("NFC", query).split())
+
+def result_cache_key(normalized_query: str) -> bytes:
+    """Result cache key of a normalize_query form, shared by every node.
+    
+    Case is folded, and a fixed-size digest keeps long queries from being
+    stored as keys.
+    """
+    return hashlib.blake2b(normalized_query.lower().encode("utf-8"), digest_size=16).digest()
+
+# Most recent queries kept per node for learning, unless overridden by
+# the "history_size" config key
+QUERY_HISTORY_SIZE = 10_000
+
+@dataclass(slots=True)
+class QueryRecord:
+    """Compact record of one processed query kept in a node's history"""
+    query: str
+    timestamp: float
+    intent: str
+    cultural_context: Dict[str, Any]
+    has_real_world_data: bool
+    response_time_ms: float
+
 class BaseLanguageNode(ABC):
     """
     Abstract base class for language-specific federated nodes
     """
     
+    # Fixed attribute layout; subclasses declare their own additional slots
+    __slots__ = (
+        "language_code", "config", "cultural_context", "local_model_state",
+        "query_history", "performance_metrics", "node_id", "version", "status",
+        "cultural_knowledge_cache", "response_cache"
+    )
+    
     def __init__(self, language_code: str, config: Dict[str, Any]):
         self.language_code = language_code
-        self.config = config
+        # Read-only view: node configuration is fixed once constructed
+        self.config = MappingProxyType(dict(config or {}))
         self.cultural_context = {}
         self.local_model_state = None
-        self.query_history = []
+        self.query_history = deque(maxlen=self.config.get("history_size", QUERY_HISTORY_SIZE))
         self.performance_metrics = {}
         
         # Node configuration
         self.node_id = f"{language_code}_node"
         self.version = "1.0.0"
         self.status = "initializing"
+        self.cultural_knowledge_cache = {}
+        self.response_cache = ResultCache(
+            self.config.get("result_cache_size", 1024),
+            self.config.get("result_cache_ttl", 300)
+        )
         
     async def initialize(self):
         """Initialize language node"""
         logger.info(f"Initializing {self.language_code} language node...")
         
         try:
-            # Load language models
-            await self._load_language_models()
-            
-            # Load cultural context
-            await self._load_cultural_context()
-            
-            # Initialize local storage
-            await self._setup_local_storage()
-            
+            # Load language models, cultural context and local storage
+            # concurrently - none of them depends on another
+            await asyncio.gather(
+                self._load_language_models(),
+                self._load_cultural_context(),
+                self._setup_local_storage()
+            )
+
             # Initialize performance tracking
             self._initialize_metrics()
             
@@ -65,11 +181,19 @@ class BaseLanguageNode(ABC):
         """Process search query with cultural context"""
         pass
     
+    async def process_queries(self, queries: List[str], context: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Process a batch of queries concurrently, returning results in order"""
+        return list(await asyncio.gather(*(self.process_query(query, context) for query in queries)))
+    
     @abstractmethod
     async def _detect_cultural_context(self, query: str) -> Dict[str, Any]:
         """Detect cultural context in query"""
         pass
         
+    def _index_cultural_context(self):
+        """Rebuild lookup structures derived from the cultural context"""
+        pass
+        
     async def _load_language_models(self):
         """Load IndicBERT and other language processing models"""
         logger.info(f"Loading IndicBERT model for {self.language_code}...")
@@ -78,6 +202,9 @@ class BaseLanguageNode(ABC):
         # In production, this would load actual IndicBERT models
         await asyncio.sleep(1)  # Simulate loading time
         
+        # Compile text kernels off the event loop so JIT cost never lands on a query
+        await asyncio.to_thread(warm_up_text_kernels)
+        
         self.local_model_state = {
             "model_name": "ai4bharat/indic-bert",
             "language": self.language_code,
@@ -91,9 +218,9 @@ class BaseLanguageNode(ABC):
     async def _setup_local_storage(self):
         """Setup local data storage"""
         # Initialize local data structures
-        self.query_history = []
+        self.query_history.clear()
         self.cultural_knowledge_cache = {}
-        self.response_cache = {}
+        self.response_cache.clear()
         
     def _initialize_metrics(self):
         """Initialize performance metrics tracking"""
@@ -106,7 +233,8 @@ class BaseLanguageNode(ABC):
         }
         
     async def health_check(self) -> Dict[str, Any]:
-        """Return node health status"""
+        """Return node health status (dict view kept for legacy callers;
+        scrapers should use metrics_exposition)"""
         return {
             "node_id": self.node_id,
             "language": self.language_code,
@@ -115,9 +243,16 @@ class BaseLanguageNode(ABC):
             "uptime": "operational",
             "model_loaded": self.local_model_state is not None,
             "cultural_context_loaded": bool(self.cultural_context),
-            "metrics": self.performance_metrics
+            "metrics": self.performance_metrics,
+            "response_cache": self.response_cache.stats()
         }
         
+    def metrics_exposition(self) -> bytes:
+        """Return node metrics in the Prometheus text exposition format"""
+        if not PROMETHEUS_AVAILABLE:
+            return b""
+        return generate_latest(NODE_METRICS_REGISTRY)
+        
     async def get_node_info(self) -> Dict[str, Any]:
         """Get detailed node information"""
         return {
@@ -153,7 +288,11 @@ class BaseLanguageNode(ABC):
     async def update_cultural_context(self, context_data: Dict[str, Any]):
         """Update cultural context with new data"""
         try:
-            self.cultural_context.update(context_data)
+            # Copy-on-write: the loaded context may be shared between nodes
+            self.cultural_context = {**self.cultural_context, **context_data}
+            self._index_cultural_context()
+            # Cached results were computed against the old context
+            self.response_cache.clear()
             logger.info(f"Updated cultural context for {self.language_code}")
         except Exception as e:
             logger.error(f"Failed to update cultural context: {e}")
@@ -195,13 +334,19 @@ class BaseLanguageNode(ABC):
         if query_success:
             self.performance_metrics["successful_queries"] += 1
             
+        if PROMETHEUS_AVAILABLE:
+            NODE_QUERIES_TOTAL.labels(self.language_code).inc()
+            if query_success:
+                NODE_QUERIES_SUCCESS.labels(self.language_code).inc()
+            NODE_RESPONSE_SECONDS.labels(self.language_code).observe(response_time / 1000)
+            
         # Update average response time
         total = self.performance_metrics["total_queries"]
         current_avg = self.performance_metrics["average_response_time"]
         new_avg = ((current_avg * (total - 1)) + response_time) / total
         self.performance_metrics["average_response_time"] = round(new_avg, 2)
         
-        self.performance_metrics["last_updated"] = datetime.now().isoformat()
+        self.performance_metrics["last_updated"] = iso_timestamp(time.time())
         
     async def shutdown(self):
         """Gracefully shutdown the node"""
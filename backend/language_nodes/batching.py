@@ -0,0 +1,105 @@
+"""
+Async Batching
+Coalesces concurrent calls made within a short window into one batch
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """
+    Collect calls submitted within ``window`` seconds and run them as one
+    batch.
+
+    Calls with the same key inside a batch are deduplicated: ``handler`` runs
+    once per unique key, concurrently across keys, and every caller gets
+    that run's result or exception. With ``batched`` set, ``handler`` is
+    instead called once per batch with the list of unique argument tuples
+    and returns the list of their results. A batch is dispatched early once
+    it holds ``max_batch`` calls.
+    """
+
+    def __init__(self, handler: Callable[..., Awaitable[Any]],
+                 window: float = 0.02, max_batch: int = 16, batched: bool = False):
+        self.handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        self.batched = batched
+        self._pending: List[Tuple[Hashable, tuple, asyncio.Future]] = []
+        self._flush_handle = None
+        # Running flushes, referenced until done so they are not collected
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, *args) -> Any:
+        """Queue a call to handler(*args) and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, args, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self):
+        """Hand the pending calls to a background flush"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task):
+        """Drop a finished flush and report it if it failed"""
+        self._flushes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Batch flush failed: {task.exception()}")
+
+    async def _flush(self, batch: List[Tuple[Hashable, tuple, asyncio.Future]]):
+        """Run the handler once per unique key and resolve every caller"""
+        waiters: Dict[Hashable, List[asyncio.Future]] = {}
+        arguments: Dict[Hashable, tuple] = {}
+        for key, args, future in batch:
+            waiters.setdefault(key, []).append(future)
+            arguments.setdefault(key, args)
+
+        keys = list(waiters)
+        try:
+            if self.batched:
+                try:
+                    results = await self.handler([arguments[key] for key in keys])
+                except Exception as e:
+                    results = [e] * len(keys)
+            else:
+                results = await asyncio.gather(
+                    *(self.handler(*arguments[key]) for key in keys),
+                    return_exceptions=True
+                )
+        except BaseException as e:
+            # Never leave callers waiting on a flush that died
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+
+        for key, result in zip(keys, results):
+            for future in waiters[key]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
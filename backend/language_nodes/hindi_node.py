@@ -4,34 +4,229 @@ Enhanced node for processing Hindi queries with real-world data integration
 """
 
 import asyncio
+import copy
 import logging
+import multiprocessing
+import os
 import re
+import sys
 import time
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 import json
 
-from .base_node import BaseLanguageNode
+from .base_node import (
+    BaseLanguageNode, QueryRecord, iso_timestamp, normalize_query, result_cache_key,
+    shared_real_world_aggregator
+)
+from .batching import AsyncBatcher
+from .semantic_cache import SENTENCE_TRANSFORMERS_AVAILABLE, SemanticCache
+from .text_utils import KeywordAutomaton, count_script_chars
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Intent keywords, matched against whole query tokens
+_TOKEN_SPLIT = re.compile(r"[\s?!.,।॥]+")
+_QUESTION_WORDS = frozenset({"कैसे", "कैसी", "कब", "क्यों", "क्या", "कहाँ"})
+_HOWTO_WORDS = frozenset({"बनाएं", "करें", "तैयार"})
+_TIMING_WORDS = frozenset({"कब", "समय", "तारीख"})
+_FACTUAL_WORDS = frozenset({"क्या", "कौन", "किस"})
+_SEARCH_WORDS = frozenset({"खोजें", "चाहिए", "सुझाव"})
+_HEALTHCARE_WORDS = frozenset({"इलाज", "नुस्खा", "दवा"})
+
+# Each keyword maps to a bitmask of the intent word sets containing it, so
+# one pass over the tokens finds every set the query touches
+_QUESTION, _HOWTO, _TIMING, _FACTUAL, _SEARCH, _HEALTHCARE = (1 << bit for bit in range(6))
+_INTENT_FLAGS: Dict[str, int] = {}
+for _flag, _words in ((_QUESTION, _QUESTION_WORDS), (_HOWTO, _HOWTO_WORDS), (_TIMING, _TIMING_WORDS),
+                      (_FACTUAL, _FACTUAL_WORDS), (_SEARCH, _SEARCH_WORDS), (_HEALTHCARE, _HEALTHCARE_WORDS)):
+    for _word in _words:
+        _INTENT_FLAGS[_word] = _INTENT_FLAGS.get(_word, 0) | _flag
+
+# Response text templates
+_MAIN_CONTENT_TEMPLATE = "**पारंपरिक ज्ञान**: {traditional}\n\n**वर्तमान जानकारी**: {current}"
+_INTRO_FESTIVAL = "भारतीय संस्कृति में '{query}' का विशेष महत्व है।"
+_INTRO_FOOD = "भारतीय खाना पकाने की परंपरा में '{query}' की अपनी विशेषता है।"
+_INTRO_HEALTHCARE = "आयुर्वेदिक चिकित्सा पद्धति के अनुसार '{query}' के बारे में जानकारी।"
+_INTRO_DEFAULT = "आपके प्रश्न '{query}' के बारे में विस्तृत जानकारी प्रस्तुत है।"
+_KNOWLEDGE_FESTIVAL = "पारंपरिक रूप से {festival} का पर्व विशेष महत्व रखता है। इसमें पारंपरिक रीति-रिवाज और सांस्कृतिक मूल्य शामिल हैं।"
+_KNOWLEDGE_HEALTHCARE = "आयुर्वेदिक परंपरा के अनुसार प्राकृतिक उपचार और घरेलू नुस्खे का उपयोग करें। तुलसी, अदरक, हल्दी जैसी जड़ी-बूटियां फायदेमंद हैं।"
+_KNOWLEDGE_HOWTO = "पारंपरिक तरीकों का पालन करते हुए, धैर्य और अभ्यास से बेहतर परिणाम प्राप्त होते हैं।"
+_KNOWLEDGE_DEFAULT = "भारतीय संस्कृति और परंपरा के अनुसार उचित मार्गदर्शन।"
+_ADVICE_HEALTHCARE = "🌿 **पारंपरिक उपाय**: तुलसी, अदरक, और हल्दी का नियमित उपयोग करें।"
+_ADVICE_HOWTO = "📋 **व्यावहारिक सुझाव**: चरणबद्ध तरीके से अभ्यास करें।"
+_ADVICE_MODERN = "🌐 **आधुनिक जानकारी**: नवीनतम शोध और विशेषज्ञों की सलाह के अनुसार अपडेटेड जानकारी।"
+_ADVICE_SAFETY = "⚠️ **सुरक्षा**: किसी भी महत्वपूर्ण निर्णय से पहले विशेषज्ञ से सलाह अवश्य लें।"
+_ADVICE_DEFAULT = "विशेषज्ञ सलाह की सिफारिश की जाती है।"
+_AYURVEDIC_APPROACH = "संतुलित आहार और प्राकृतिक उपचार का प्रयोग करें"
+_HEALTHCARE_DISCLAIMER = "गंभीर समस्या होने पर डॉक्टर से सलाह लें"
+_CULINARY_CONTEXT = "भारतीय खाना पकाने की परंपरा"
+_GENERAL_SUGGESTION = "कृपया अधिक विशिष्ट जानकारी के लिए प्रश्न को स्पष्ट करें।"
+
+# Preparation guides for festivals with a dedicated write-up
+_FESTIVAL_GUIDES: Dict[str, str] = {
+    "दिवाली": """
+            दिवाली की तैयारी के लिए:
+            1. घर की अच्छी तरह सफाई और सजावट करें
+            2. दीये, मोमबत्तियां और रोशनी की व्यवस्था करें
+            3. रंगोली बनाएं
+            4. मिठाइयां बनाएं और अपनों में बांटें
+            5. लक्ष्मी पूजा की सामग्री तैयार रखें
+            """,
+    "होली": """
+            होली की तैयारी के लिए:
+            1. प्राकृतिक और सुरक्षित रंग चुनें
+            2. होलिका दहन के लिए लकड़ी और सामग्री जुटाएं
+            3. गुजिया और ठंडाई तैयार करें
+            4. त्वचा और बालों पर पहले से तेल लगाएं
+            5. परिवार और मित्रों के साथ मिलकर उत्सव मनाएं
+            """
+}
+
+@dataclass(slots=True)
+class ScriptInfo:
+    """Script composition of a query as found by HindiNode._detect_script"""
+    primary_script: str
+    devanagari_ratio: float
+    roman_ratio: float
+    mixed_script: Optional[bool] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form used in query results; mixed_script is omitted when
+        the query has no characters to classify"""
+        info = {
+            "primary_script": self.primary_script,
+            "devanagari_ratio": self.devanagari_ratio,
+            "roman_ratio": self.roman_ratio
+        }
+        if self.mixed_script is not None:
+            info["mixed_script"] = self.mixed_script
+        return info
+
+def _freeze(value: Any) -> Any:
+    """Turn lists into tuples and intern strings throughout loaded JSON"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _freeze(item) for key, item in value.items()}
+    return value
+
+@dataclass(slots=True)
+class HindiQueryResult:
+    """Query-independent part of a processed query, as kept in the result
+    caches. The response quotes the query, so it is built for each call
+    and passed to to_dict, which hands each caller its own copies of the
+    cached parts."""
+    script: ScriptInfo
+    intent: str
+    cultural_context: Dict[str, Any]
+    real_world_data: Optional[Dict[str, Any]]
+    confidence: float
+    
+    def to_dict(self, query: str, response: Dict[str, Any], response_time_ms: float, timestamp: str) -> Dict[str, Any]:
+        """Result dict returned by HindiNode.process_query"""
+        return {
+            "query": query,
+            "language": "hindi",
+            "script": self.script.to_dict(),
+            "intent": self.intent,
+            "cultural_context": copy.deepcopy(self.cultural_context),
+            "real_world_data": copy.deepcopy(self.real_world_data),
+            "response": response,
+            "confidence": self.confidence,
+            "response_time_ms": response_time_ms,
+            "timestamp": timestamp,
+            "node_id": "hindi_node_enhanced"
+        }
+
+@lru_cache(maxsize=None)
+def _shared_cultural_context() -> Mapping[str, Any]:
+    """Hindi cultural knowledge base, loaded on first use and shared
+    read-only by every node instance"""
+    context_path = Path(__file__).with_name("hindi_cultural_context.json")
+    if ORJSON_AVAILABLE:
+        # Parses the UTF-8 bytes directly, without decoding to str first
+        return MappingProxyType(_freeze(orjson.loads(context_path.read_bytes())))
+    with open(context_path, encoding="utf-8") as context_file:
+        return MappingProxyType(_freeze(json.load(context_file)))
+
+def _build_keyword_index(cultural_context: Mapping[str, Any]) -> Tuple[KeywordAutomaton, List[Tuple[str, Any]]]:
+    """Build the keyword automaton used by HindiNode._detect_cultural_context.
+    
+    Each keyword's payload is an id into a list of prebuilt
+    (context field, entry) records, numbered in the order of the
+    cultural context dicts so hits keep that order.
+    """
+    automaton = KeywordAutomaton()
+    entries = []
+    
+    def add_entry(keywords, field, entry):
+        for keyword in keywords:
+            automaton.add(unicodedata.normalize("NFC", keyword), len(entries))
+        entries.append((field, entry))
+    
+    for festival, info in cultural_context["festivals"].items():
+        add_entry((festival, info["english"].lower()), "festivals", {
+            "name": festival,
+            "english": info["english"],
+            "significance": info["significance"]
+        })
+        
+    for category, items in cultural_context["food"]["पारंपरिक व्यंजन"].items():
+        for item in items:
+            add_entry((item,), "food_items", {
+                "item": item,
+                "category": category
+            })
+            
+    for condition, remedies in cultural_context["healthcare"]["घरेलू नुस्खे"].items():
+        add_entry(condition.split(), "healthcare_topics", {
+            "condition": condition,
+            "remedies": remedies
+        })
+            
+    for scheme in cultural_context["government_schemes"]["केंद्र सरकार"]:
+        add_entry(scheme.split(), "government_schemes", scheme)
+            
+    return automaton.build(), entries
+
+@lru_cache(maxsize=None)
+def _shared_keyword_index() -> Tuple[KeywordAutomaton, List[Tuple[str, Any]]]:
+    """Keyword index of the shared cultural context, built on first use"""
+    return _build_keyword_index(_shared_cultural_context())
+
 class HindiNode(BaseLanguageNode):
     """
     Enhanced Hindi language federated learning node with real-world data integration
     """
     
+    __slots__ = (
+        "google_cse", "real_world_aggregator", "real_world_enabled",
+        "cultural_domains", "_keyword_automaton",
+        "_context_entries", "_inflight", "semantic_cache",
+        "_detection_batcher"
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("hi", config or {})
         
         # Initialize real-world data integration
         try:
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            from core.real_world_data import GoogleCSEIntegration, RealWorldDataAggregator
-            
-            self.google_cse = GoogleCSEIntegration()
-            self.real_world_aggregator = RealWorldDataAggregator(self.google_cse)
+            self.real_world_aggregator = shared_real_world_aggregator()
+            self.google_cse = self.real_world_aggregator.google_cse
             self.real_world_enabled = True
             logger.info("✅ Real-world data integration enabled for Hindi Node")
         except Exception as e:
@@ -39,17 +234,43 @@ class HindiNode(BaseLanguageNode):
             self.real_world_enabled = False
         
         # Hindi-specific configurations
-        self.script_patterns = {
-            "devanagari": re.compile(r'[\u0900-\u097F]+'),
-            "roman": re.compile(r'[a-zA-Z]+')
-        }
-        
         # Cultural knowledge domains
         self.cultural_domains = [
             "festivals", "food", "healthcare", "education", 
             "traditions", "business", "government"
         ]
         
+        # Built from the cultural context by _index_cultural_context
+        self._keyword_automaton = KeywordAutomaton()
+        self._context_entries = []
+        
+        # Real-world fetches currently in flight, keyed by query
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Opt-in micro-batching of query detection ("detection_batching"
+        # config key): concurrent queries share one detection run
+        self._detection_batcher = None
+        if self.config.get("detection_batching"):
+            self._detection_batcher = AsyncBatcher(
+                self._detect_batch,
+                window=self.config.get("detection_batch_window_ms", 5) / 1000,
+                max_batch=self.config.get("detection_batch_size", 32),
+                batched=True
+            )
+        
+        # Opt-in cache answering paraphrased queries ("semantic_cache"
+        # config key)
+        self.semantic_cache = None
+        if self.config.get("semantic_cache"):
+            if SENTENCE_TRANSFORMERS_AVAILABLE:
+                self.semantic_cache = SemanticCache(
+                    self.config.get("result_cache_size", 1024),
+                    self.config.get("semantic_cache_threshold", 0.9),
+                    self.config.get("result_cache_ttl", 300)
+                )
+            else:
+                logger.warning("⚠️ Semantic cache disabled: sentence-transformers is not installed")
+        
         # Performance tracking
         self.performance_metrics = {
             "total_queries": 0,
@@ -63,193 +284,144 @@ class HindiNode(BaseLanguageNode):
         """Load Hindi/Indian cultural context"""
         logger.info("Loading Hindi cultural context...")
         
-        self.cultural_context = {
-            "festivals": {
-                "दिवाली": {
-                    "english": "Diwali",
-                    "significance": "Festival of Lights, celebrating victory of light over darkness",
-                    "timing": "October/November (Hindu calendar: Kartik Amavasya)",
-                    "traditions": [
-                        "घर की सफाई और सजावट",
-                        "दीये और मोमबत्तियां जलाना", 
-                        "रंगोली बनाना",
-                        "मिठाइयां बांटना",
-                        "लक्ष्मी पूजा"
-                    ],
-                    "regional_variations": {
-                        "उत्तर भारत": "5 दिन का त्योहार, धनतेरस से भाई दूज तक",
-                        "दक्षिण भारत": "नरक चतुर्दशी पर मुख्य उत्सव",
-                        "पश्चिम भारत": "गुजराती नव वर्ष के साथ मनाया जाता है"
-                    }
-                },
-                "होली": {
-                    "english": "Holi", 
-                    "significance": "Festival of Colors, celebrating spring and love",
-                    "timing": "March (Hindu calendar: Phalguna Purnima)",
-                    "traditions": [
-                        "रंग खेलना",
-                        "गुजिया और ठंडाई",
-                        "होलिका दहन",
-                        "मस्ती और उत्सव"
-                    ]
-                },
-                "करवा चौथ": {
-                    "english": "Karva Chauth",
-                    "significance": "Fast observed by married women for husband's long life",
-                    "timing": "October/November (Kartik Krishna Chaturthi)",
-                    "traditions": [
-                        "चांद देखकर व्रत खोलना",
-                        "सुहागन का श्रृंगार",
-                        "करवा चौथ की कथा"
-                    ]
-                }
-            },
-            
-            "food": {
-                "पारंपरिक व्यंजन": {
-                    "उत्तर भारतीय": [
-                        "रोटी", "नान", "पराठा", "राजमा", "छोले", "दाल मखनी",
-                        "बिरयानी", "पुलाव", "आलू गोभी", "पनीर मखनी"
-                    ],
-                    "दक्षिण भारतीय": [
-                        "डोसा", "इडली", "वडा", "उत्तपम", "रसम", "सांबर", 
-                        "नारियल चटनी", "मीनाक्षी भात"
-                    ],
-                    "मिठाइयां": [
-                        "गुलाब जामुन", "रसगुल्ला", "जलेबी", "खीर", "हलवा",
-                        "बर्फी", "लड्डू", "रसमलाई"
-                    ]
-                },
-                "त्योहारी खाना": {
-                    "दिवाली": ["गुजिया", "शकरपारे", "नमकीन", "मिठाइयां"],
-                    "होली": ["गुजिया", "ठंडाई", "दही भल्ले"],
-                    "करवा चौथ": ["सरगी", "फेनी", "मिठाइयां"]
-                }
-            },
-            
-            "healthcare": {
-                "घरेलू नुस्खे": {
-                    "सर्दी-खांसी": [
-                        "अदरक और शहद का काढ़ा",
-                        "तुलसी की पत्तियों का रस",
-                        "गर्म पानी में नमक के गरारे",
-                        "हल्दी वाला दूध"
-                    ],
-                    "बुखार": [
-                        "तुलसी और काली मिर्च का काढ़ा", 
-                        "गिलोय का रस",
-                        "नीम की पत्तियों का काढ़ा"
-                    ],
-                    "पेट दर्द": [
-                        "अजवाइन का पानी",
-                        "पुदीने की चाय",
-                        "हींग और गुड़ का मिश्रण"
-                    ]
-                },
-                "आयुर्वेदिक सिद्धांत": {
-                    "त्रिदोष": ["वात", "पित्त", "कफ"],
-                    "षड्रस": ["मधुर", "अम्ल", "लवण", "कटु", "तिक्त", "कषाय"],
-                    "दिनचर्या": ["ब्रह्ममुहूर्त जागना", "योग और प्राणायाम", "संतुलित आहार"]
-                }
-            },
-            
-            "education": {
-                "पारंपरिक शिक्षा": {
-                    "गुरुकुल प्रणाली": "गुरु-शिष्य परंपरा",
-                    "वेदाध्ययन": "चार वेद - ऋग्वेद, यजुर्वेद, सामवेद, अथर्ववेद",
-                    "धर्म और नैतिकता": "सत्य, अहिंसा, करुणा"
-                },
-                "आधुनिक शिक्षा": {
-                    "भाषा": "हिंदी, अंग्रेजी, क्षेत्रीय भाषाएं",
-                    "विषय": "गणित, विज्ञान, सामाजिक अध्ययन",
-                    "बोर्ड": "CBSE, ICSE, राज्य बोर्ड"
-                }
-            },
-            
-            "government_schemes": {
-                "केंद्र सरकार": {
-                    "प्रधानमंत्री आवास योजना": "गरीबों के लिए पक्के मकान",
-                    "जन धन योजना": "बैंक खाते खोलना",
-                    "आयुष्मान भारत": "स्वास्थ्य बीमा योजना",
-                    "किसान सम्मान निधि": "किसानों को आर्थिक सहायता"
-                }
-            }
-        }
+        # Shared, read-only context loaded by the first node to need it
+        self.cultural_context = _shared_cultural_context()
         
+        self._index_cultural_context()
         logger.info("Hindi cultural context loaded successfully")
         
+    def _index_cultural_context(self):
+        """Point _detect_cultural_context at the keyword index for the
+        current cultural context, reusing the prebuilt one when unchanged"""
+        if self.cultural_context is _shared_cultural_context():
+            self._keyword_automaton, self._context_entries = _shared_keyword_index()
+        else:
+            self._keyword_automaton, self._context_entries = _build_keyword_index(self.cultural_context)
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+        
     async def process_query(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Enhanced Hindi search query processing with real-world data"""
+        start_ns = time.perf_counter_ns()
         start_time = time.time()
-        self.performance_metrics["total_queries"] += 1
+        timestamp = iso_timestamp(start_time)
         
         try:
-            logger.info(f"Processing Hindi query: {query[:50]}...")
+            # Per-query logs are only formatted when INFO is enabled
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info(f"Processing Hindi query: {query[:50]}...")
             
-            # 1. Detect script and language validation
-            script_info = await self._detect_script(query)
+            # Normalized forms shared by all detection passes; NFC makes
+            # nukta letters typed precomposed (e.g. U+095C ड़) match the keywords
+            normalized = normalize_query(query)
+            query_lower = normalized.lower()
             
-            # 2. Extract cultural context
-            cultural_context = await self._detect_cultural_context(query)
+            # Repeated queries are answered from the result cache
+            cache_key = result_cache_key(normalized)
+            cached_result = self.response_cache.get(cache_key)
             
-            # 3. Process query based on intent
-            intent = await self._classify_intent(query)
+            # Paraphrases of a cached query are answered from the semantic
+            # cache, which only holds records free of any query's text
+            embedding = None
+            if cached_result is None and self.semantic_cache is not None:
+                try:
+                    embedding = await self.semantic_cache.embed(query_lower)
+                    cached_result = self.semantic_cache.get(embedding)
+                except Exception as e:
+                    logger.warning(f"Semantic cache disabled: {e}")
+                    self.semantic_cache = None
+                    
+            if cached_result is not None:
+                # Only the response quotes the query, so it is rebuilt
+                response = self._generate_enhanced_response(
+                    query, cached_result.intent, cached_result.cultural_context, cached_result.real_world_data
+                )
+                response_time = (time.perf_counter_ns() - start_ns) / 1e6
+                self._update_metrics(True, response_time)
+                self.query_history.append(QueryRecord(
+                    query=query,
+                    timestamp=start_time,
+                    intent=cached_result.intent,
+                    cultural_context=cached_result.cultural_context,
+                    has_real_world_data=cached_result.real_world_data is not None,
+                    response_time_ms=response_time
+                ))
+                return cached_result.to_dict(query, response, round(response_time, 2), timestamp)
+            
+            # 1-3. Detect script, cultural context and intent, batched with
+            # concurrent queries and/or in a worker process when enabled
+            if self._detection_batcher is not None:
+                script_info, cultural_context, intent = await self._detection_batcher.submit(
+                    normalized, normalized, query_lower
+                )
+            elif self._uses_detection_pool():
+                loop = asyncio.get_running_loop()
+                script_info, cultural_context, intent = await loop.run_in_executor(
+                    _get_detection_pool(), _detect_in_worker, normalized
+                )
+            else:
+                script_info, cultural_context, intent = self._run_detection(normalized, query_lower)
             
             # 4. Determine if real-world data is needed
-            needs_real_world_data = await self._should_fetch_real_world_data(query, intent, cultural_context)
+            needs_real_world_data = self._should_fetch_real_world_data(normalized, intent, cultural_context)
             
             # 5. Get real-world data if needed and available
             real_world_data = None
+            fetch_failed = False
             if needs_real_world_data and self.real_world_enabled:
                 try:
-                    self.performance_metrics["real_world_queries"] += 1
-                    real_world_data = self.real_world_aggregator.get_real_world_context(
-                        query, 'hindi', cultural_context
-                    )
+                    metrics = self.performance_metrics
+                    metrics["real_world_queries"] = metrics.get("real_world_queries", 0) + 1
+                    real_world_data = await self._fetch_real_world_context(normalized, cultural_context)
                 except Exception as e:
+                    fetch_failed = True
                     logger.warning(f"Real-world data fetch failed: {e}")
             
             # 6. Generate culturally-aware response
-            response = await self._generate_enhanced_response(query, intent, cultural_context, real_world_data)
+            response = self._generate_enhanced_response(query, intent, cultural_context, real_world_data)
             
             # Calculate response time
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Update metrics
             self._update_metrics(True, response_time)
             
             # Store query for learning
-            self.query_history.append({
-                "query": query,
-                "timestamp": start_time,
-                "intent": intent,
-                "cultural_context": cultural_context,
-                "has_real_world_data": real_world_data is not None,
-                "response_time_ms": response_time
-            })
+            self.query_history.append(QueryRecord(
+                query=query,
+                timestamp=start_time,
+                intent=intent,
+                cultural_context=cultural_context,
+                has_real_world_data=real_world_data is not None,
+                response_time_ms=response_time
+            ))
             
-            result = {
-                "query": query,
-                "language": "hindi",
-                "script": script_info,
-                "intent": intent,
-                "cultural_context": cultural_context,
-                "real_world_data": real_world_data,
-                "response": response,
-                "confidence": self._calculate_confidence(cultural_context, real_world_data),
-                "response_time_ms": round(response_time, 2),
-                "timestamp": datetime.fromtimestamp(start_time).isoformat(),
-                "node_id": "hindi_node_enhanced"
-            }
+            record = HindiQueryResult(
+                script=script_info,
+                intent=intent,
+                cultural_context=cultural_context,
+                real_world_data=real_world_data,
+                confidence=self._calculate_confidence(cultural_context, real_world_data)
+            )
+            result = record.to_dict(query, response, round(response_time, 2), timestamp)
+            
+            # A failed fetch is retried on the next request instead of cached
+            if not fetch_failed:
+                self.response_cache.put(cache_key, record)
+                # Real-world data carries the searched query and a summary of its
+                # results, so it is never shared with paraphrases
+                if embedding is not None and self.semantic_cache is not None and real_world_data is None:
+                    self.semantic_cache.put(embedding, record)
             
-            self.performance_metrics["successful_queries"] += 1
-            logger.info(f"✅ Successfully processed Hindi query in {response_time:.2f}ms")
+            if log_info:
+                logger.info(f"✅ Successfully processed Hindi query in {response_time:.2f}ms")
             
             return result
             
         except Exception as e:
             # Update metrics for failed query
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             self._update_metrics(False, response_time)
             
             logger.error(f"Error processing Hindi query: {e}")
@@ -257,99 +429,59 @@ class HindiNode(BaseLanguageNode):
                 "error": str(e),
                 "query": query,
                 "language": "hindi",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "response_time_ms": round(response_time, 2)
             }
             
-    async def _detect_script(self, query: str) -> Dict[str, Any]:
+    async def _fetch_real_world_context(self, query: str, cultural_context: Dict) -> Dict:
+        """Fetch real-world context, sharing one fetch between concurrent
+        identical queries"""
+        task = self._inflight.get(query)
+        if task is None:
+            task = asyncio.ensure_future(self.real_world_aggregator.async_get_real_world_context(
+                query, 'hindi', cultural_context
+            ))
+            self._inflight[query] = task
+            task.add_done_callback(lambda _: self._inflight.pop(query, None))
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+        
+    def _uses_detection_pool(self) -> bool:
+        """Whether detection runs in the shared worker process pool"""
+        return bool(self.config.get("detection_process_pool")) and self.cultural_context is _shared_cultural_context()
+        
+    async def _detect_batch(self, batch: List[Tuple[str, str]]) -> List[Tuple[ScriptInfo, Dict[str, Any], str]]:
+        """Run detection for a batch of (query, query_lower) pairs; called
+        by the detection batcher"""
+        if self._uses_detection_pool():
+            # One worker round trip for the whole batch
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _get_detection_pool(), _detect_batch_in_worker, [query for query, _ in batch]
+            )
+        return [self._run_detection(query, query_lower) for query, query_lower in batch]
+        
+    def _run_detection(self, query: str, query_lower: str) -> Tuple[ScriptInfo, Dict[str, Any], str]:
+        """Run the CPU-bound detection steps of process_query"""
+        return _run_detection(query, query_lower, (self._keyword_automaton, self._context_entries))
+        
+    def _detect_script(self, query: str) -> ScriptInfo:
         """Detect script used in query"""
-        devanagari_chars = len(self.script_patterns["devanagari"].findall(query))
-        roman_chars = len(self.script_patterns["roman"].findall(query))
-        
-        total_chars = len(query.replace(" ", ""))
-        
-        if total_chars == 0:
-            return {"primary_script": "unknown", "devanagari_ratio": 0, "roman_ratio": 0}
-            
-        devanagari_ratio = devanagari_chars / total_chars
-        roman_ratio = roman_chars / total_chars
-        
-        primary_script = "devanagari" if devanagari_ratio > roman_ratio else "roman"
+        return _detect_script(query)
         
-        return {
-            "primary_script": primary_script,
-            "devanagari_ratio": round(devanagari_ratio, 2),
-            "roman_ratio": round(roman_ratio, 2),
-            "mixed_script": devanagari_ratio > 0.1 and roman_ratio > 0.1
-        }
-        
-    async def _detect_cultural_context(self, query: str) -> Dict[str, Any]:
+    def _detect_cultural_context(self, query: str, query_lower: Optional[str] = None) -> Dict[str, Any]:
         """Detect cultural context in Hindi query"""
-        context = {
-            "festivals": [],
-            "food_items": [],
-            "healthcare_topics": [],
-            "government_schemes": [],
-            "cultural_significance": []
-        }
+        if query_lower is None:
+            query_lower = query.lower()
+        return _match_cultural_context(query_lower, (self._keyword_automaton, self._context_entries))
         
-        query_lower = query.lower()
-        
-        # Festival detection
-        for festival, info in self.cultural_context["festivals"].items():
-            if festival in query_lower or info["english"].lower() in query_lower:
-                context["festivals"].append({
-                    "name": festival,
-                    "english": info["english"],
-                    "significance": info["significance"]
-                })
-                
-        # Food item detection
-        for category, items in self.cultural_context["food"]["पारंपरिक व्यंजन"].items():
-            for item in items:
-                if item in query_lower:
-                    context["food_items"].append({
-                        "item": item,
-                        "category": category
-                    })
-                    
-        # Healthcare topic detection
-        for condition, remedies in self.cultural_context["healthcare"]["घरेलू नुस्खे"].items():
-            if any(keyword in query_lower for keyword in condition.split()):
-                context["healthcare_topics"].append({
-                    "condition": condition,
-                    "remedies": remedies
-                })
-                
-        # Government scheme detection
-        for scheme in self.cultural_context["government_schemes"]["केंद्र सरकार"].keys():
-            if any(word in query_lower for word in scheme.split()):
-                context["government_schemes"].append(scheme)
-                
-        return context
-        
-    async def _classify_intent(self, query: str) -> str:
+    def _classify_intent(self, query: str, query_lower: Optional[str] = None) -> str:
         """Classify query intent"""
-        query_lower = query.lower()
-        
-        # Intent classification based on keywords
-        if any(word in query_lower for word in ["कैसे", "कैसी", "कब", "क्यों", "क्या", "कहाँ"]):
-            if any(word in query_lower for word in ["बनाएं", "करें", "तैयार"]):
-                return "how_to"
-            elif any(word in query_lower for word in ["कब", "समय", "तारीख"]):
-                return "timing_information"
-            elif any(word in query_lower for word in ["क्या", "कौन", "किस"]):
-                return "factual_question"
-            else:
-                return "informational"
-        elif any(word in query_lower for word in ["खोजें", "चाहिए", "सुझाव"]):
-            return "search_recommendation"
-        elif any(word in query_lower for word in ["इलाज", "नुस्खा", "दवा"]):
-            return "healthcare_advice"
-        else:
-            return "general_query"
+        if query_lower is None:
+            query_lower = query.lower()
+        return _classify_intent(query_lower)
             
-    async def _generate_response(self, query: str, intent: str, cultural_context: Dict) -> Dict[str, Any]:
+    def _generate_response(self, query: str, intent: str, cultural_context: Dict) -> Dict[str, Any]:
         """Generate culturally-aware response"""
         
         # Generate response based on intent and cultural context
@@ -361,7 +493,7 @@ class HindiNode(BaseLanguageNode):
                 "title": f"{festival['name']} की तैयारी कैसे करें",
                 "content": self._generate_festival_guide(festival["name"]),
                 "cultural_significance": festival["significance"],
-                "traditional_practices": self.cultural_context["festivals"][festival["name"]].get("traditions", [])
+                "traditional_practices": self.cultural_context["festivals"][festival["name"]].get("traditions", ())
             }
             
         elif intent == "healthcare_advice" and cultural_context["healthcare_topics"]:
@@ -371,8 +503,8 @@ class HindiNode(BaseLanguageNode):
                 "type": "healthcare_advice",
                 "condition": topic["condition"],
                 "traditional_remedies": topic["remedies"],
-                "ayurvedic_approach": "संतुलित आहार और प्राकृतिक उपचार का प्रयोग करें",
-                "disclaimer": "गंभीर समस्या होने पर डॉक्टर से सलाह लें"
+                "ayurvedic_approach": _AYURVEDIC_APPROACH,
+                "disclaimer": _HEALTHCARE_DISCLAIMER
             }
             
         elif cultural_context["food_items"]:
@@ -383,7 +515,7 @@ class HindiNode(BaseLanguageNode):
                 "dish": food_item["item"],
                 "category": food_item["category"],
                 "preparation_tips": f"{food_item['item']} बनाने की पारंपरिक विधि",
-                "cultural_context": "भारतीय खाना पकाने की परंपरा"
+                "cultural_context": _CULINARY_CONTEXT
             }
             
         else:
@@ -391,11 +523,15 @@ class HindiNode(BaseLanguageNode):
             return {
                 "type": "general_response", 
                 "content": f"आपके प्रश्न '{query}' के बारे में जानकारी प्रदान करने का प्रयास कर रहे हैं।",
-                "suggestion": "कृपया अधिक विशिष्ट जानकारी के लिए प्रश्न को स्पष्ट करें।"
+                "suggestion": _GENERAL_SUGGESTION
             }
             
     def _generate_festival_guide(self, festival_name: str) -> str:
         """Generate festival preparation guide"""
+        return _FESTIVAL_GUIDES.get(
+            festival_name, f"{festival_name} की पारंपरिक तैयारी की जानकारी।"
+        )
+        
     async def health_check(self) -> Dict[str, Any]:
         """Enhanced health check including real-world data status"""
         basic_health = await super().health_check()
@@ -404,7 +540,7 @@ class HindiNode(BaseLanguageNode):
         real_world_status = "disconnected"
         if self.real_world_enabled:
             try:
-                test_results = self.google_cse.search_with_language_context("भारत", "hindi", 1)
+                test_results = await self.google_cse.async_search_with_language_context("भारत", "hindi", 1)
                 real_world_status = "connected" if test_results else "limited"
             except:
                 real_world_status = "error"
@@ -414,12 +550,13 @@ class HindiNode(BaseLanguageNode):
             "real_world_enabled": self.real_world_enabled,
             "performance_metrics": self.performance_metrics,
             "cache_size": len(self.real_world_aggregator.cache) if self.real_world_enabled else 0,
+            "semantic_cache": self.semantic_cache.stats() if self.semantic_cache is not None else None,
             "enhanced_features": "enabled" if self.real_world_enabled else "disabled"
         })
         
         return basic_health
         
-    async def _should_fetch_real_world_data(self, query: str, intent: str, cultural_context: Dict) -> bool:
+    def _should_fetch_real_world_data(self, query: str, intent: str, cultural_context: Dict) -> bool:
         """Determine if real-world data should be fetched"""
         # Fetch real-world data for current events, news, or when cultural context is limited
         real_world_intents = ['current_events', 'news', 'government_schemes', 'recent_information']
@@ -437,7 +574,7 @@ class HindiNode(BaseLanguageNode):
         
         return False
     
-    async def _generate_enhanced_response(self, query: str, intent: str, cultural_context: Dict, real_world_data: Dict = None) -> Dict:
+    def _generate_enhanced_response(self, query: str, intent: str, cultural_context: Dict, real_world_data: Dict = None) -> Dict:
         """Generate comprehensive response combining cultural and real-world data"""
         
         response = {
@@ -451,11 +588,10 @@ class HindiNode(BaseLanguageNode):
         
         # Combine cultural knowledge with real-world information
         if real_world_data and real_world_data.get('has_real_world_data'):
-            response["main_content"] = f"""
-**पारंपरिक ज्ञान**: {self._get_traditional_knowledge(cultural_context, intent)}
-
-**वर्तमान जानकारी**: {real_world_data['summary']}
-            """.strip()
+            response["main_content"] = _MAIN_CONTENT_TEMPLATE.format(
+                traditional=self._get_traditional_knowledge(cultural_context, intent),
+                current=real_world_data['summary']
+            ).strip()
             
             # Add real-world sources
             response["additional_resources"] = [
@@ -479,28 +615,28 @@ class HindiNode(BaseLanguageNode):
     def _get_cultural_introduction(self, cultural_context: Dict, query: str) -> str:
         """Generate cultural introduction based on context"""
         if cultural_context.get('festivals'):
-            return f"भारतीय संस्कृति में '{query}' का विशेष महत्व है।"
+            return _INTRO_FESTIVAL.format(query=query)
         elif cultural_context.get('food_items'):
-            return f"भारतीय खाना पकाने की परंपरा में '{query}' की अपनी विशेषता है।"
+            return _INTRO_FOOD.format(query=query)
         elif cultural_context.get('healthcare_topics'):
-            return f"आयुर्वेदिक चिकित्सा पद्धति के अनुसार '{query}' के बारे में जानकारी।"
+            return _INTRO_HEALTHCARE.format(query=query)
         else:
-            return f"आपके प्रश्न '{query}' के बारे में विस्तृत जानकारी प्रस्तुत है।"
+            return _INTRO_DEFAULT.format(query=query)
     
     def _get_traditional_knowledge(self, cultural_context: Dict, intent: str) -> str:
         """Get traditional knowledge based on context"""
         if cultural_context.get('festivals'):
             festival = cultural_context['festivals'][0]
             festival_name = festival.get('name', 'त्योहार') if isinstance(festival, dict) else str(festival)
-            return f"पारंपरिक रूप से {festival_name} का पर्व विशेष महत्व रखता है। इसमें पारंपरिक रीति-रिवाज और सांस्कृतिक मूल्य शामिल हैं।"
+            return _KNOWLEDGE_FESTIVAL.format(festival=festival_name)
         
         if cultural_context.get('healthcare_topics'):
-            return "आयुर्वेदिक परंपरा के अनुसार प्राकृतिक उपचार और घरेलू नुस्खे का उपयोग करें। तुलसी, अदरक, हल्दी जैसी जड़ी-बूटियां फायदेमंद हैं।"
+            return _KNOWLEDGE_HEALTHCARE
         
         if intent == "how_to":
-            return "पारंपरिक तरीकों का पालन करते हुए, धैर्य और अभ्यास से बेहतर परिणाम प्राप्त होते हैं।"
+            return _KNOWLEDGE_HOWTO
         
-        return "भारतीय संस्कृति और परंपरा के अनुसार उचित मार्गदर्शन।"
+        return _KNOWLEDGE_DEFAULT
     
     def _generate_practical_advice(self, cultural_context: Dict, intent: str, real_world_data: Dict = None) -> str:
         """Generate practical advice combining traditional and modern knowledge"""
@@ -508,33 +644,28 @@ class HindiNode(BaseLanguageNode):
         
         # Traditional advice
         if cultural_context.get('healthcare_topics'):
-            advice_parts.append("🌿 **पारंपरिक उपाय**: तुलसी, अदरक, और हल्दी का नियमित उपयोग करें।")
+            advice_parts.append(_ADVICE_HEALTHCARE)
         
         if intent == "how_to":
-            advice_parts.append("📋 **व्यावहारिक सुझाव**: चरणबद्ध तरीके से अभ्यास करें।")
+            advice_parts.append(_ADVICE_HOWTO)
         
         # Modern advice from real-world data
         if real_world_data and real_world_data.get('has_real_world_data'):
-            advice_parts.append("🌐 **आधुनिक जानकारी**: नवीनतम शोध और विशेषज्ञों की सलाह के अनुसार अपडेटेड जानकारी।")
+            advice_parts.append(_ADVICE_MODERN)
         
         # Safety advice
-        advice_parts.append("⚠️ **सुरक्षा**: किसी भी महत्वपूर्ण निर्णय से पहले विशेषज्ञ से सलाह अवश्य लें।")
+        advice_parts.append(_ADVICE_SAFETY)
         
-        return "\n".join(advice_parts) if advice_parts else "विशेषज्ञ सलाह की सिफारिश की जाती है।"
+        return "\n".join(advice_parts) if advice_parts else _ADVICE_DEFAULT
     
     def _calculate_confidence(self, cultural_context: Dict, real_world_data: Dict = None) -> float:
         """Calculate confidence score based on available data"""
-        confidence = 0.6  # Base confidence
-        
-        if cultural_context.get('festivals') or cultural_context.get('food_items'):
-            confidence += 0.2
-        
-        if real_world_data and real_world_data.get('has_real_world_data'):
-            confidence += 0.2
-            if len(real_world_data.get('search_results', [])) >= 3:
-                confidence += 0.1
+        has_cultural = bool(cultural_context.get('festivals') or cultural_context.get('food_items'))
+        has_real_world = bool(real_world_data and real_world_data.get('has_real_world_data'))
+        many_results = has_real_world and len(real_world_data.get('search_results', ())) >= 3
         
-        return min(confidence, 1.0)
+        # Base confidence of 0.6 plus a bonus for each kind of supporting data
+        return min(0.6 + 0.2 * has_cultural + 0.2 * has_real_world + 0.1 * many_results, 1.0)
     
     def _update_performance_metrics(self, processing_time: float):
         """Update performance metrics"""
@@ -543,3 +674,118 @@ class HindiNode(BaseLanguageNode):
             self.performance_metrics["total_response_time"] / 
             max(self.performance_metrics["total_queries"], 1)
         )
+
+
+# Detection steps, shared by HindiNode and the detection worker processes
+def _run_detection(
+    query: str, query_lower: str, keyword_index: Tuple[KeywordAutomaton, List[Tuple[str, Any]]]
+) -> Tuple[ScriptInfo, Dict[str, Any], str]:
+    """Detect script, cultural context and intent of a query"""
+    # 1. Detect script and language validation
+    script_info = _detect_script(query)
+    
+    # 2. Extract cultural context
+    cultural_context = _match_cultural_context(query_lower, keyword_index)
+    
+    # 3. Process query based on intent
+    intent = _classify_intent(query_lower)
+    
+    return script_info, cultural_context, intent
+
+def _detect_script(query: str) -> ScriptInfo:
+    """Detect script used in query"""
+    devanagari_chars, roman_chars, total_chars = count_script_chars(query)
+    
+    if total_chars == 0:
+        return ScriptInfo("unknown", 0, 0)
+        
+    devanagari_ratio = devanagari_chars / total_chars
+    roman_ratio = roman_chars / total_chars
+    
+    primary_script = "devanagari" if devanagari_ratio > roman_ratio else "roman"
+    
+    return ScriptInfo(
+        primary_script,
+        round(devanagari_ratio, 2),
+        round(roman_ratio, 2),
+        devanagari_ratio > 0.1 and roman_ratio > 0.1
+    )
+
+def _match_cultural_context(
+    query_lower: str, keyword_index: Tuple[KeywordAutomaton, List[Tuple[str, Any]]]
+) -> Dict[str, Any]:
+    """Match a lowercased query against a keyword index"""
+    context = {
+        "festivals": [],
+        "food_items": [],
+        "healthcare_topics": [],
+        "government_schemes": [],
+        "cultural_significance": []
+    }
+    
+    # Single automaton scan; each entry is reported once
+    automaton, entries = keyword_index
+    for entry_id in sorted(set(automaton.iter_matches(query_lower))):
+        field, entry = entries[entry_id]
+        context[field].append(entry)
+            
+    return context
+
+def _classify_intent(query_lower: str) -> str:
+    """Classify query intent"""
+    # Intent classification based on whole-word keyword membership
+    flags = 0
+    intent_flags = _INTENT_FLAGS
+    for token in _TOKEN_SPLIT.split(query_lower):
+        flags |= intent_flags.get(token, 0)
+    
+    if flags & _QUESTION:
+        if flags & _HOWTO:
+            return "how_to"
+        elif flags & _TIMING:
+            return "timing_information"
+        elif flags & _FACTUAL:
+            return "factual_question"
+        else:
+            return "informational"
+    elif flags & _SEARCH:
+        return "search_recommendation"
+    elif flags & _HEALTHCARE:
+        return "healthcare_advice"
+    else:
+        return "general_query"
+
+
+# Opt-in process pool for query detection ("detection_process_pool" config
+# key). Workers detect against the shared cultural context, so
+# the pool is only used by nodes that still share that context.
+_DETECTION_POOL: Optional[ProcessPoolExecutor] = None
+_WORKER_INDEX: Optional[Tuple[KeywordAutomaton, List[Tuple[str, Any]]]] = None
+
+def _get_detection_pool() -> ProcessPoolExecutor:
+    """Create the detection process pool shared by all Hindi nodes"""
+    global _DETECTION_POOL
+    if _DETECTION_POOL is None:
+        # The API server is multithreaded and forking it can deadlock, so
+        # workers are started from a fresh forkserver or spawned process
+        methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in methods else "spawn"
+        _DETECTION_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(method),
+            initializer=_init_detection_worker,
+        )
+    return _DETECTION_POOL
+
+def _init_detection_worker():
+    """Build the keyword index used for detection inside a worker process"""
+    global _WORKER_INDEX
+    _WORKER_INDEX = _shared_keyword_index()
+
+def _detect_in_worker(query: str) -> Tuple[ScriptInfo, Dict[str, Any], str]:
+    """Worker-process entry point running Hindi query detection"""
+    return _run_detection(query, query.lower(), _WORKER_INDEX)
+
+def _detect_batch_in_worker(queries: List[str]) -> List[Tuple[ScriptInfo, Dict[str, Any], str]]:
+    """Worker-process entry point running Hindi query detection for a batch"""
+    return [_run_detection(query, query.lower(), _WORKER_INDEX) for query in queries]
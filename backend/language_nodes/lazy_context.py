@@ -0,0 +1,45 @@
+"""
+Lazy Cultural Context
+Read-only cultural context mapping whose categories are built on first use
+"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List
+
+
+class LazyCulturalContext(Mapping):
+    """
+    Cultural context that builds each category only when it is first read.
+
+    ``loaders`` maps category names to zero-argument callables returning
+    that category's data. Listing, counting and membership tests use the
+    category names alone, so only categories that are actually indexed
+    into are ever materialized.
+    """
+
+    __slots__ = ("_loaders", "_loaded")
+
+    def __init__(self, loaders: Mapping[str, Callable[[], Any]]):
+        self._loaders = dict(loaders)
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, category: str) -> Any:
+        try:
+            return self._loaded[category]
+        except KeyError:
+            value = self._loaders[category]()
+            self._loaded[category] = value
+            return value
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._loaders
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def loaded_categories(self) -> List[str]:
+        """Names of the categories built so far"""
+        return list(self._loaded)
@@ -4,238 +4,348 @@ Specialized node for processing Marathi queries with Maharashtra cultural contex
 """
 
 import asyncio
+import copy
 import logging
 import re
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import time
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from types import MappingProxyType
 
-from .base_node import BaseLanguageNode
+from .base_node import (
+    BaseLanguageNode, QueryRecord, iso_timestamp, normalize_query, result_cache_key,
+    shared_real_world_aggregator
+)
+from .text_utils import KeywordAutomaton, count_script_chars
 
 logger = logging.getLogger(__name__)
 
+# Intent keywords, each group matched anywhere in the query by one regex
+_QUESTION_WORDS = re.compile("कसे|कसा|कधी|का|काय|कुठे|कोण")
+_HOWTO_WORDS = re.compile("करावे|बनवावे|तयार")
+_TIMING_WORDS = re.compile("कधी|वेळ|काळ")
+_FACTUAL_WORDS = re.compile("काय|कोण|कुठे")
+_SEARCH_WORDS = re.compile("हवे|पाहिजे|सूचना")
+_BUSINESS_WORDS = re.compile("व्यापार|बिझनेस|धंदा")
+
+# Preparation guides for festivals with a dedicated write-up
+_FESTIVAL_GUIDES: Dict[str, str] = {
+    "गणेशचतुर्थी": """
+            गणेशचतुर्थी साजरी करण्यासाठी:
+            1. घराची सफाई करा आणि तोरण लावा
+            2. गणपती मूर्ती घरात आणा
+            3. मोदक, लाडू तयार करा
+            4. दररोज आरती करा
+            5. विसर्जनाची तयारी करा
+            """,
+    "गुढी पाडवा": """
+            गुढी पाडवा साजरा करण्यासाठी:
+            1. घराची सफाई करा
+            2. गुढी तयार करून उभारा
+            3. तोरण लावा
+            4. पूरणपोळी आणि श्रीखंड तयार करा
+            5. नवीन कपडे घाला
+            """
+}
+
+# Maharashtra cultural knowledge base, shared read-only by every MarathiNode
+_CULTURAL_CONTEXT = MappingProxyType({
+    "festivals": {
+        "गणेशचतुर्थी": {
+            "english": "Ganesh Chaturthi",
+            "significance": "Birth celebration of Lord Ganesha, most important festival in Maharashtra",
+            "timing": "August/September (Bhadrapada Shukla Chaturthi)",
+            "traditions": [
+                "गणपती बाप्पा घरात आणणे",
+                "मोदक आणि लाडू तयार करणे",
+                "आरती आणि भजन करणे",
+                "विसर्जन सणात सहभाग घेणे"
+            ],
+            "duration": "1.5, 3, 5, 7, 11 दिवस",
+            "special_locations": ["लालबागचा राजा", "सिद्धिविनायक", "दगडूशेठ हळवाई"]
+        },
+        "गुढी पाडवा": {
+            "english": "Gudi Padwa",
+            "significance": "Marathi New Year",
+            "timing": "March/April (Chaitra Shukla Pratipada)",
+            "traditions": [
+                "गुढी उभारणे",
+                "घरांना तोरण लावणे",
+                "पूरणपोळी आणि श्रीखंड खाणे",
+                "नवीन कपडे घालणे"
+            ]
+        },
+        "नवरात्री": {
+            "english": "Navratri",
+            "significance": "Nine nights of Goddess Durga worship",
+            "timing": "September/October",
+            "traditions": [
+                "गरबा आणि डांडिया खेळणे",
+                "देवीची पूजा करणे",
+                "उपास ठेवणे"
+            ]
+        },
+        "दिवाळी": {
+            "english": "Diwali", 
+            "significance": "Festival of lights",
+            "timing": "October/November",
+            "traditions": [
+                "घरांची सफाई करणे",
+                "रांगोळी काढणे",
+                "दिवे लावणे",
+                "फराळ तयार करणे"
+            ]
+        }
+    },
+    
+    "food": {
+        "महाराष्ट्रीयन खाना": {
+            "मुख्य जेवण": [
+                "भाकरी", "भात", "डाळ", "भाजी", "रस्सा", "कढी",
+                "सांबर", "आमटी", "वरण", "उसळ"
+            ],
+            "नाश्ता": [
+                "पोहा", "उपमा", "मिसळ पाव", "दही पोहा", "सातू",
+                "शीरा", "खीर", "ज्वारीची भाकरी"
+            ],
+            "फराळ": [
+                "साबुदाणा खिचडी", "राजगिरा लाडू", "आलू वडी",
+                "शिंगदाणा चिकी", "खजूर पाकं"
+            ],
+            "मिठाई": [
+                "मोदक", "पूरणपोळी", "शेवयंची खीर", "श्रीखंड",
+                "आंबे रस", "सोलकढी"
+            ]
+        },
+        "प्रादेशिक खाना": {
+            "कोंकणी": ["फिश करी", "सोल कढी", "कोकम शर्बत"],
+            "विदर्भ": ["वरण फळ", "भर्ली वांगी", "सांजा"],
+            "मराठवाडा": ["ज्वारीची भाकरी", "झुणका भाकरी", "पिठला भाकरी"]
+        }
+    },
+    
+    "business": {
+        "महाराष्ट्रीयन व्यापारी समुदाय": {
+            "मारवाडी": "राजस्थानी व्यापारी समुदाय",
+            "गुजराती": "गुजरातची व्यापारी संस्कृती",
+            "महाराष्ट्रीयन": "स्थानिक व्यापारी पारंपरिक"
+        },
+        "मुख्य व्यापारी केंद्रे": {
+            "मुंबई": "आर्थिक राजधानी, शेअर बाजार",
+            "पुणे": "IT हब, उत्पादन केंद्र",
+            "नागपूर": "भारताचे भौगोलिक केंद्र",
+            "औरंगाबाद": "MIDC, औद्योगिक केंद्र"
+        },
+        "स्टार्टअप इकोसिस्टम": {
+            "मुंबई": "फिनटेक, मीडिया, एंटरटेनमेंट",
+            "पुणे": "IT, automotive, engineering"
+        }
+    },
+    
+    "arts": {
+        "नृत्य": [
+            "लावणी", "कथक", "तमाशा", "कोळी गीत",
+            "गोवळण", "धनगरी गौरी"
+        ],
+        "संगीत": [
+            "नट्यसंगीत", "सुगम संगीत", "लोकगीते",
+            "भावगीते", "भक्तिगीते"
+        ],
+        "रंगभूमी": [
+            "व्यावसायिक थिएटर", "प्रयोगशील नाटक",
+            "एकांकिका", "बालनाट्य"
+        ]
+    },
+    
+    "literature": {
+        "आधुनिक मराठी साहित्य": {
+            "कवी": ["कुसुमाग्रज", "बी. एस. मर्ढेकर", "वृंदा करंदीकर"],
+            "कथाकार": ["पु. ल. देशपांडे", "व्यंकटेश माडगूळकर", "बाळ फोंडके"],
+            "नाटककार": ["विजय तेंडुलकर", "गिरीश कर्नाड", "महेश एळकुंचवार"]
+        },
+        "संत साहित्य": {
+            "संत तुकाराम": "अभंगे आणि गाथा",
+            "संत ज्ञानेश्वर": "ज्ञानेश्वरी",
+            "संत एकनाथ": "एकनाथी भागवत",
+            "संत नामदेव": "भक्ति काव्य"
+        }
+    },
+    
+    "history": {
+        "मराठा साम्राज्य": {
+            "छत्रपती शिवाजी महाराज": "मराठा साम्राज्याचे संस्थापक",
+            "संभाजी महाराज": "शिवाजी महाराजाचे पुत्र",
+            "राजाराम महाराज": "मराठा प्रतिकार",
+            "ताराबाई": "मराठा राणी"
+        },
+        "पेशवा काळ": {
+            "बाजीराव पेशवे": "मराठा शक्तीचा विस्तार",
+            "नानासाहेब पेशवे": "मराठा संघराज्य"
+        }
+    },
+    
+    "traditions": {
+        "धार्मिक परंपरा": [
+            "वारी", "पंढरपूर यात्रा", "गणपती उत्सव",
+            "नवरात्री", "महाशिवरात्री"
+        ],
+        "सामाजिक परंपरा": [
+            "हळदी कुंकू", "वत पूर्णिमा", "कर्णपिशाचणी",
+            "नामकरण", "जतकर्म"
+        ]
+    }
+})
+
+def _build_keyword_index(cultural_context: Mapping[str, Any]) -> Tuple[KeywordAutomaton, List[Tuple[str, Any]]]:
+    """Build the keyword automaton used by MarathiNode._detect_cultural_context.
+    
+    Each keyword's payload is an id into a list of prebuilt
+    (context field, entry) records, numbered in the order of the
+    cultural context dicts so hits keep that order.
+    """
+    automaton = KeywordAutomaton()
+    entries = []
+    
+    def add_entry(keywords, field, entry):
+        for keyword in keywords:
+            automaton.add(keyword, len(entries))
+        entries.append((field, entry))
+    
+    for festival, info in cultural_context["festivals"].items():
+        add_entry((festival, info["english"].lower()), "festivals", {
+            "name": festival,
+            "english": info["english"],
+            "significance": info["significance"]
+        })
+        
+    for category, items in cultural_context["food"]["महाराष्ट्रीयन खाना"].items():
+        for item in items:
+            add_entry((item,), "food_items", {
+                "item": item,
+                "category": category
+            })
+            
+    for business_center, description in cultural_context["business"]["मुख्य व्यापारी केंद्रे"].items():
+        add_entry((business_center,), "business_topics", {
+            "center": business_center,
+            "description": description
+        })
+        
+    for figure, description in cultural_context["history"]["मराठा साम्राज्य"].items():
+        add_entry(figure.split(), "historical_figures", {
+            "name": figure,
+            "description": description
+        })
+        
+    return automaton.build(), entries
+
+_KEYWORD_INDEX = _build_keyword_index(_CULTURAL_CONTEXT)
+
 class MarathiNode(BaseLanguageNode):
     """
     Marathi language federated learning node with Maharashtra cultural context
     """
     
+    __slots__ = ("cultural_domains", "_keyword_automaton", "_context_entries")
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__("mr", config)
         
         # Marathi-specific configurations
-        self.script_patterns = {
-            "devanagari": re.compile(r'[\u0900-\u097F]+'),
-            "roman": re.compile(r'[a-zA-Z]+')
-        }
-        
         # Cultural knowledge domains
         self.cultural_domains = [
             "festivals", "food", "business", "arts", "history",
             "literature", "traditions", "saints"
         ]
         
+        # Built from the cultural context by _index_cultural_context
+        self._keyword_automaton = KeywordAutomaton()
+        self._context_entries = []
+        
     async def _load_cultural_context(self):
         """Load Marathi/Maharashtra cultural context"""
         logger.info("Loading Marathi cultural context...")
         
-        self.cultural_context = {
-            "festivals": {
-                "गणेशचतुर्थी": {
-                    "english": "Ganesh Chaturthi",
-                    "significance": "Birth celebration of Lord Ganesha, most important festival in Maharashtra",
-                    "timing": "August/September (Bhadrapada Shukla Chaturthi)",
-                    "traditions": [
-                        "गणपती बाप्पा घरात आणणे",
-                        "मोदक आणि लाडू तयार करणे",
-                        "आरती आणि भजन करणे",
-                        "विसर्जन सणात सहभाग घेणे"
-                    ],
-                    "duration": "1.5, 3, 5, 7, 11 दिवस",
-                    "special_locations": ["लालबागचा राजा", "सिद्धिविनायक", "दगडूशेठ हळवाई"]
-                },
-                "गुढी पाडवा": {
-                    "english": "Gudi Padwa",
-                    "significance": "Marathi New Year",
-                    "timing": "March/April (Chaitra Shukla Pratipada)",
-                    "traditions": [
-                        "गुढी उभारणे",
-                        "घरांना तोरण लावणे",
-                        "पूरणपोळी आणि श्रीखंड खाणे",
-                        "नवीन कपडे घालणे"
-                    ]
-                },
-                "नवरात्री": {
-                    "english": "Navratri",
-                    "significance": "Nine nights of Goddess Durga worship",
-                    "timing": "September/October",
-                    "traditions": [
-                        "गरबा आणि डांडिया खेळणे",
-                        "देवीची पूजा करणे",
-                        "उपास ठेवणे"
-                    ]
-                },
-                "दिवाळी": {
-                    "english": "Diwali", 
-                    "significance": "Festival of lights",
-                    "timing": "October/November",
-                    "traditions": [
-                        "घरांची सफाई करणे",
-                        "रांगोळी काढणे",
-                        "दिवे लावणे",
-                        "फराळ तयार करणे"
-                    ]
-                }
-            },
-            
-            "food": {
-                "महाराष्ट्रीयन खाना": {
-                    "मुख्य जेवण": [
-                        "भाकरी", "भात", "डाळ", "भाजी", "रस्सा", "कढी",
-                        "सांबर", "आमटी", "वरण", "उसळ"
-                    ],
-                    "नाश्ता": [
-                        "पोहा", "उपमा", "मिसळ पाव", "दही पोहा", "सातू",
-                        "शीरा", "खीर", "ज्वारीची भाकरी"
-                    ],
-                    "फराळ": [
-                        "साबुदाणा खिचडी", "राजगिरा लाडू", "आलू वडी",
-                        "शिंगदाणा चिकी", "खजूर पाकं"
-                    ],
-                    "मिठाई": [
-                        "मोदक", "पूरणपोळी", "शेवयंची खीर", "श्रीखंड",
-                        "आंबे रस", "सोलकढी"
-                    ]
-                },
-                "प्रादेशिक खाना": {
-                    "कोंकणी": ["फिश करी", "सोल कढी", "कोकम शर्बत"],
-                    "विदर्भ": ["वरण फळ", "भर्ली वांगी", "सांजा"],
-                    "मराठवाडा": ["ज्वारीची भाकरी", "झुणका भाकरी", "पिठला भाकरी"]
-                }
-            },
-            
-            "business": {
-                "महाराष्ट्रीयन व्यापारी समुदाय": {
-                    "मारवाडी": "राजस्थानी व्यापारी समुदाय",
-                    "गुजराती": "गुजरातची व्यापारी संस्कृती",
-                    "महाराष्ट्रीयन": "स्थानिक व्यापारी पारंपरिक"
-                },
-                "मुख्य व्यापारी केंद्रे": {
-                    "मुंबई": "आर्थिक राजधानी, शेअर बाजार",
-                    "पुणे": "IT हब, उत्पादन केंद्र",
-                    "नागपूर": "भारताचे भौगोलिक केंद्र",
-                    "औरंगाबाद": "MIDC, औद्योगिक केंद्र"
-                },
-                "स्टार्टअप इकोसिस्टम": {
-                    "मुंबई": "फिनटेक, मीडिया, एंटरटेनमेंट",
-                    "पुणे": "IT, automotive, engineering"
-                }
-            },
-            
-            "arts": {
-                "नृत्य": [
-                    "लावणी", "कथक", "तमाशा", "कोळी गीत",
-                    "गोवळण", "धनगरी गौरी"
-                ],
-                "संगीत": [
-                    "नट्यसंगीत", "सुगम संगीत", "लोकगीते",
-                    "भावगीते", "भक्तिगीते"
-                ],
-                "रंगभूमी": [
-                    "व्यावसायिक थिएटर", "प्रयोगशील नाटक",
-                    "एकांकिका", "बालनाट्य"
-                ]
-            },
-            
-            "literature": {
-                "आधुनिक मराठी साहित्य": {
-                    "कवी": ["कुसुमाग्रज", "बी. एस. मर्ढेकर", "वृंदा करंदीकर"],
-                    "कथाकार": ["पु. ल. देशपांडे", "व्यंकटेश माडगूळकर", "बाळ फोंडके"],
-                    "नाटककार": ["विजय तेंडुलकर", "गिरीश कर्नाड", "महेश एळकुंचवार"]
-                },
-                "संत साहित्य": {
-                    "संत तुकाराम": "अभंगे आणि गाथा",
-                    "संत ज्ञानेश्वर": "ज्ञानेश्वरी",
-                    "संत एकनाथ": "एकनाथी भागवत",
-                    "संत नामदेव": "भक्ति काव्य"
-                }
-            },
-            
-            "history": {
-                "मराठा साम्राज्य": {
-                    "छत्रपती शिवाजी महाराज": "मराठा साम्राज्याचे संस्थापक",
-                    "संभाजी महाराज": "शिवाजी महाराजाचे पुत्र",
-                    "राजाराम महाराज": "मराठा प्रतिकार",
-                    "ताराबाई": "मराठा राणी"
-                },
-                "पेशवा काळ": {
-                    "बाजीराव पेशवे": "मराठा शक्तीचा विस्तार",
-                    "नानासाहेब पेशवे": "मराठा संघराज्य"
-                }
-            },
-            
-            "traditions": {
-                "धार्मिक परंपरा": [
-                    "वारी", "पंढरपूर यात्रा", "गणपती उत्सव",
-                    "नवरात्री", "महाशिवरात्री"
-                ],
-                "सामाजिक परंपरा": [
-                    "हळदी कुंकू", "वत पूर्णिमा", "कर्णपिशाचणी",
-                    "नामकरण", "जतकर्म"
-                ]
-            }
-        }
+        # Shared, read-only context; nodes never copy it
+        self.cultural_context = _CULTURAL_CONTEXT
         
+        self._index_cultural_context()
         logger.info("Marathi cultural context loaded successfully")
         
+    def _index_cultural_context(self):
+        """Point _detect_cultural_context at the keyword index for the
+        current cultural context, reusing the prebuilt one when unchanged"""
+        if self.cultural_context is _CULTURAL_CONTEXT:
+            self._keyword_automaton, self._context_entries = _KEYWORD_INDEX
+        else:
+            self._keyword_automaton, self._context_entries = _build_keyword_index(self.cultural_context)
+        
     async def process_query(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Process Marathi search query with cultural context and real-world data"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+        start_time = time.time()
+        timestamp = iso_timestamp(start_time)
         
         try:
             logger.info(f"Processing Marathi query: {query[:50]}...")
             
-            # Detect script and language validation
-            script_info = await self._detect_script(query)
-            
-            # Extract cultural context
-            cultural_context = await self._detect_cultural_context(query)
+            # Detection runs on the normalized form, so every query sharing
+            # a cache key gets the same detections
+            normalized = normalize_query(query)
             
-            # Process query based on intent
-            intent = await self._classify_intent(query)
-            
-            # Get real-world data if available
-            real_world_data = {}
-            try:
-                from ..core.real_world_data import GoogleCSEIntegration, RealWorldDataAggregator
+            # Repeated queries reuse the cached detections and real-world
+            # data; the response quotes the query, so it is built per call
+            cache_key = result_cache_key(normalized)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                # Deep copy so callers cannot mutate the cached entry
+                script_info, intent, cultural_context, real_world_data = copy.deepcopy(cached)
+            else:
+                # Detect script and language validation
+                script_info = self._detect_script(normalized)
                 
-                google_cse = GoogleCSEIntegration()
-                aggregator = RealWorldDataAggregator(google_cse)
+                # Extract cultural context
+                cultural_context = self._detect_cultural_context(normalized)
                 
-                logger.info(f"🔍 Fetching real-world data for Marathi query: {query}")
-                real_world_data = aggregator.get_real_world_context(query, "marathi", cultural_context)
-                logger.info(f"✅ Found {len(real_world_data.get('search_results', []))} real results")
+                # Process query based on intent
+                intent = self._classify_intent(normalized)
                 
-            except Exception as rwd_error:
-                logger.warning(f"Real-world data fetch failed: {rwd_error}")
-                real_world_data = {"search_results": [], "error": str(rwd_error)}
+                # Get real-world data if available
+                real_world_data = {}
+                try:
+                    aggregator = shared_real_world_aggregator()
+                    
+                    logger.info(f"🔍 Fetching real-world data for Marathi query: {normalized}")
+                    real_world_data = await aggregator.async_get_real_world_context(normalized, "marathi", cultural_context)
+                    logger.info(f"✅ Found {len(real_world_data.get('search_results', []))} real results")
+                    
+                except Exception as rwd_error:
+                    logger.warning(f"Real-world data fetch failed: {rwd_error}")
+                    real_world_data = {"search_results": [], "error": str(rwd_error)}
+                
+                # Failed real-world fetches are retried rather than cached
+                if "error" not in real_world_data:
+                    self.response_cache.put(cache_key, copy.deepcopy(
+                        (script_info, intent, cultural_context, real_world_data)
+                    ))
             
             # Generate culturally-aware response with real-world data
             response = await self._generate_response(query, intent, cultural_context, real_world_data)
             
             # Calculate response time
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Update metrics
             self._update_metrics(True, response_time)
             
             # Store query for learning
-            self.query_history.append({
-                "query": query,
-                "timestamp": start_time.isoformat(),
-                "intent": intent,
-                "cultural_context": cultural_context,
-                "response_time_ms": response_time,
-                "has_real_world_data": len(real_world_data.get('search_results', [])) > 0
-            })
+            self.query_history.append(QueryRecord(
+                query=query,
+                timestamp=start_time,
+                intent=intent,
+                cultural_context=cultural_context,
+                has_real_world_data=len(real_world_data.get('search_results', [])) > 0,
+                response_time_ms=response_time
+            ))
             
             return {
                 "query": query,
@@ -247,12 +357,12 @@ class MarathiNode(BaseLanguageNode):
                 "response": response,
                 "confidence": 0.86,  # Simulated confidence
                 "response_time_ms": round(response_time, 2),
-                "timestamp": start_time.isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
             # Update metrics for failed query
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             self._update_metrics(False, response_time)
             
             logger.error(f"Error processing Marathi query: {e}")
@@ -260,15 +370,12 @@ class MarathiNode(BaseLanguageNode):
                 "error": str(e),
                 "query": query,
                 "language": "marathi",
-                "timestamp": start_time.isoformat()
+                "timestamp": timestamp
             }
             
-    async def _detect_script(self, query: str) -> Dict[str, Any]:
+    def _detect_script(self, query: str) -> Dict[str, Any]:
         """Detect script used in Marathi query"""
-        devanagari_chars = len(self.script_patterns["devanagari"].findall(query))
-        roman_chars = len(self.script_patterns["roman"].findall(query))
-        
-        total_chars = len(query.replace(" ", ""))
+        devanagari_chars, roman_chars, total_chars = count_script_chars(query)
         
         if total_chars == 0:
             return {"primary_script": "unknown", "devanagari_ratio": 0, "roman_ratio": 0}
@@ -285,7 +392,7 @@ class MarathiNode(BaseLanguageNode):
             "mixed_script": devanagari_ratio > 0.1 and roman_ratio > 0.1
         }
         
-    async def _detect_cultural_context(self, query: str) -> Dict[str, Any]:
+    def _detect_cultural_context(self, query: str) -> Dict[str, Any]:
         """Detect cultural context in Marathi query"""
         context = {
             "festivals": [],
@@ -296,61 +403,30 @@ class MarathiNode(BaseLanguageNode):
             "literature": []
         }
         
-        query_lower = query.lower()
-        
-        # Festival detection
-        for festival, info in self.cultural_context["festivals"].items():
-            if festival in query or info["english"].lower() in query_lower:
-                context["festivals"].append({
-                    "name": festival,
-                    "english": info["english"],
-                    "significance": info["significance"]
-                })
-                
-        # Food detection
-        for category, items in self.cultural_context["food"]["महाराष्ट्रीयन खाना"].items():
-            for item in items:
-                if item in query:
-                    context["food_items"].append({
-                        "item": item,
-                        "category": category
-                    })
-                    
-        # Business context detection
-        for business_center, description in self.cultural_context["business"]["मुख्य व्यापारी केंद्रे"].items():
-            if business_center in query:
-                context["business_topics"].append({
-                    "center": business_center,
-                    "description": description
-                })
-                
-        # Historical figures detection
-        for figure, description in self.cultural_context["history"]["मराठा साम्राज्य"].items():
-            if any(word in query for word in figure.split()):
-                context["historical_figures"].append({
-                    "name": figure,
-                    "description": description
-                })
+        # Single automaton scan over the lowered query; the Marathi terms
+        # have no case, so only the English festival names are affected
+        entries = self._context_entries
+        for entry_id in sorted(set(self._keyword_automaton.iter_matches(query.lower()))):
+            field, entry = entries[entry_id]
+            context[field].append(entry)
                 
         return context
         
-    async def _classify_intent(self, query: str) -> str:
+    def _classify_intent(self, query: str) -> str:
         """Classify Marathi query intent"""
-        query_lower = query.lower()
-        
         # Marathi question words and intent classification
-        if any(word in query for word in ["कसे", "कसा", "कधी", "का", "काय", "कुठे", "कोण"]):
-            if any(word in query for word in ["करावे", "बनवावे", "तयार"]):
+        if _QUESTION_WORDS.search(query):
+            if _HOWTO_WORDS.search(query):
                 return "how_to"
-            elif any(word in query for word in ["कधी", "वेळ", "काळ"]):
+            elif _TIMING_WORDS.search(query):
                 return "timing_information"
-            elif any(word in query for word in ["काय", "कोण", "कुठे"]):
+            elif _FACTUAL_WORDS.search(query):
                 return "factual_question"
             else:
                 return "informational"
-        elif any(word in query for word in ["हवे", "पाहिजे", "सूचना"]):
+        elif _SEARCH_WORDS.search(query):
             return "search_recommendation"
-        elif any(word in query for word in ["व्यापार", "बिझनेस", "धंदा"]):
+        elif _BUSINESS_WORDS.search(query):
             return "business_advice"
         else:
             return "general_query"
@@ -393,78 +469,80 @@ class MarathiNode(BaseLanguageNode):
                 "confidence_level": "high"
             }
         
-        # Fallback to cultural context responses
-        if intent == "how_to" and cultural_context["festivals"]:
-            # Festival-related how-to query
-            festival = cultural_context["festivals"][0]
-            return {
-                "type": "cultural_guide",
-                "title": f"{festival['name']} कसे साजरे करावे",
-                "content": self._generate_festival_guide(festival["name"]),
-                "cultural_significance": festival["significance"],
-                "traditional_practices": self.cultural_context["festivals"][festival["name"]].get("traditions", [])
-            }
-            
-        elif intent == "business_advice" and cultural_context["business_topics"]:
-            # Business-related query
-            business_topic = cultural_context["business_topics"][0]
-            return {
-                "type": "business_information",
-                "center": business_topic["center"],
-                "description": business_topic["description"],
-                "business_opportunities": "महाराष्ट्रातील व्यापारी संधी",
-                "cultural_context": "महाराष्ट्रीयन व्यापारी संस्कृती"
-            }
-            
-        elif cultural_context["food_items"]:
-            # Food-related query
-            food_item = cultural_context["food_items"][0]
-            return {
-                "type": "culinary_information",
-                "dish": food_item["item"],
-                "category": food_item["category"],
-                "preparation_info": f"{food_item['item']} कसे बनवावे",
-                "cultural_context": "महाराष्ट्रीयन स्वयंपाक परंपरा"
-            }
-            
-        elif cultural_context["historical_figures"]:
-            # Historical query
-            figure = cultural_context["historical_figures"][0]
-            return {
-                "type": "historical_information",
-                "figure": figure["name"],
-                "description": figure["description"],
-                "significance": "मराठा इतिहासातील महत्वपूर्ण व्यक्तिमत्व"
-            }
-            
-        else:
-            # General response
-            return {
-                "type": "general_response",
-                "content": f"तुमच्या प्रश्न '{query}' बद्दल माहिती देण्याचा प्रयत्न करत आहे.",
-                "suggestion": "कृपया अधिक स्पष्ट माहितीसाठी प्रश्न नक्की करा.",
-                "confidence_level": "medium"
-            }
+        # Intent-specific response, when the query has the context it needs
+        dispatch = self._INTENT_RESPONDERS.get(intent)
+        if dispatch is not None:
+            field, responder = dispatch
+            if cultural_context[field]:
+                return responder(self, cultural_context[field][0])
+                
+        # Otherwise answer from the first kind of context the query has
+        for field, responder in self._CONTEXT_RESPONDERS:
+            if cultural_context[field]:
+                return responder(self, cultural_context[field][0])
+                
+        # General response
+        return {
+            "type": "general_response",
+            "content": f"तुमच्या प्रश्न '{query}' बद्दल माहिती देण्याचा प्रयत्न करत आहे.",
+            "suggestion": "कृपया अधिक स्पष्ट माहितीसाठी प्रश्न नक्की करा.",
+            "confidence_level": "medium"
+        }
+        
+    def _festival_guide_response(self, festival: Dict[str, Any]) -> Dict[str, Any]:
+        """Festival-related how-to response"""
+        return {
+            "type": "cultural_guide",
+            "title": f"{festival['name']} कसे साजरे करावे",
+            "content": self._generate_festival_guide(festival["name"]),
+            "cultural_significance": festival["significance"],
+            "traditional_practices": self.cultural_context["festivals"][festival["name"]].get("traditions", [])
+        }
+        
+    def _business_response(self, business_topic: Dict[str, Any]) -> Dict[str, Any]:
+        """Business-related response"""
+        return {
+            "type": "business_information",
+            "center": business_topic["center"],
+            "description": business_topic["description"],
+            "business_opportunities": "महाराष्ट्रातील व्यापारी संधी",
+            "cultural_context": "महाराष्ट्रीयन व्यापारी संस्कृती"
+        }
+        
+    def _culinary_response(self, food_item: Dict[str, Any]) -> Dict[str, Any]:
+        """Food-related response"""
+        return {
+            "type": "culinary_information",
+            "dish": food_item["item"],
+            "category": food_item["category"],
+            "preparation_info": f"{food_item['item']} कसे बनवावे",
+            "cultural_context": "महाराष्ट्रीयन स्वयंपाक परंपरा"
+        }
+        
+    def _historical_response(self, figure: Dict[str, Any]) -> Dict[str, Any]:
+        """Historical response"""
+        return {
+            "type": "historical_information",
+            "figure": figure["name"],
+            "description": figure["description"],
+            "significance": "मराठा इतिहासातील महत्वपूर्ण व्यक्तिमत्व"
+        }
+        
+    # Intent -> (cultural context field it needs, responder for that field's
+    # first entry)
+    _INTENT_RESPONDERS = {
+        "how_to": ("festivals", _festival_guide_response),
+        "business_advice": ("business_topics", _business_response)
+    }
+    
+    # Fallback responders, tried in order when no intent responder applies
+    _CONTEXT_RESPONDERS = (
+        ("food_items", _culinary_response),
+        ("historical_figures", _historical_response)
+    )
             
     def _generate_festival_guide(self, festival_name: str) -> str:
         """Generate Marathi festival preparation guide"""
-        if festival_name == "गणेशचतुर्थी":
-            return """
-            गणेशचतुर्थी साजरी करण्यासाठी:
-            1. घराची सफाई करा आणि तोरण लावा
-            2. गणपती मूर्ती घरात आणा
-            3. मोदक, लाडू तयार करा
-            4. दररोज आरती करा
-            5. विसर्जनाची तयारी करा
-            """
-        elif festival_name == "गुढी पाडवा":
-            return """
-            गुढी पाडवा साजरा करण्यासाठी:
-            1. घराची सफाई करा
-            2. गुढी तयार करून उभारा
-            3. तोरण लावा
-            4. पूरणपोळी आणि श्रीखंड तयार करा
-            5. नवीन कपडे घाला
-            """
-        else:
-            return f"{festival_name} ची पारंपरिक साजरी करण्याची माहिती."
+        return _FESTIVAL_GUIDES.get(
+            festival_name, f"{festival_name} ची पारंपरिक साजरी करण्याची माहिती."
+        )
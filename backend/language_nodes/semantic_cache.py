@@ -0,0 +1,171 @@
+"""
+Semantic Cache
+Bounded LRU cache of query results matched by embedding similarity
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+
+class SemanticCache:
+    """
+    LRU cache of query results looked up by the meaning of the query.
+
+    Queries are embedded with a multilingual sentence encoder, loaded on
+    first use. A lookup returns the result of the most similar cached query
+    when its cosine similarity reaches ``threshold``, so paraphrases share
+    one result. Hits move an entry to the front; once ``capacity`` entries
+    are held the least recently used one is evicted, and entries older than
+    ``ttl`` seconds are ignored.
+
+    Up to ``lsh_min_size`` entries every key is compared. Larger caches only
+    compare keys sharing a random-projection LSH bucket with the query in at
+    least one of ``lsh_tables`` tables of ``lsh_bits`` bits each.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.9, ttl: float = 300.0,
+                 model_name: str = DEFAULT_EMBEDDING_MODEL, lsh_min_size: int = 1000,
+                 lsh_tables: int = 4, lsh_bits: int = 12):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self.model_name = model_name
+        self.lsh_min_size = lsh_min_size
+        self.hits = 0
+        self.misses = 0
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._num_tables = lsh_tables
+        self._num_bits = lsh_bits
+        self._bit_weights = 1 << np.arange(lsh_bits, dtype=np.int64)
+
+        # Slot storage, allocated once the embedding dimension is known
+        self._keys: Optional["np.ndarray"] = None
+        self._projections: List["np.ndarray"] = []
+        self._values: List[Any] = [None] * capacity
+        self._stored_at: List[float] = [0.0] * capacity
+        self._bucket_ids: List[Optional[tuple]] = [None] * capacity
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(lsh_tables)]
+        # Occupied slots, least recently used first
+        self._order: "OrderedDict[int, None]" = OrderedDict()
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def _encode(self, text: str) -> "np.ndarray":
+        """Embed text as a unit-length float32 vector"""
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+        embedding = self._model.encode(text, normalize_embeddings=True)
+        return np.asarray(embedding, dtype=np.float32)
+
+    async def embed(self, text: str) -> "np.ndarray":
+        """Embed a query off the event loop"""
+        return await asyncio.to_thread(self._encode, text)
+
+    def _bucket_keys(self, embedding: "np.ndarray") -> tuple:
+        """LSH bucket of an embedding in every table"""
+        return tuple(
+            int((embedding @ projection > 0) @ self._bit_weights)
+            for projection in self._projections
+        )
+
+    def _candidates(self, embedding: "np.ndarray") -> "np.ndarray":
+        """Slots whose keys are compared against a query embedding"""
+        if len(self._order) <= self.lsh_min_size:
+            return np.fromiter(self._order, dtype=np.int64, count=len(self._order))
+        slots: Set[int] = set()
+        for buckets, bucket in zip(self._buckets, self._bucket_keys(embedding)):
+            slots.update(buckets.get(bucket, ()))
+        return np.fromiter(slots, dtype=np.int64, count=len(slots))
+
+    def get(self, embedding: "np.ndarray") -> Optional[Dict[str, Any]]:
+        """Return the result cached for the most similar query, or None"""
+        if self._order:
+            slots = self._candidates(embedding)
+            if len(slots):
+                similarities = self._keys[slots] @ embedding
+                best = int(np.argmax(similarities))
+                slot = int(slots[best])
+                if similarities[best] >= self.threshold:
+                    if time.monotonic() - self._stored_at[slot] <= self.ttl:
+                        self._order.move_to_end(slot)
+                        self.hits += 1
+                        return self._values[slot]
+                    self._release(slot)
+        self.misses += 1
+        return None
+
+    def put(self, embedding: "np.ndarray", value: Dict[str, Any]):
+        """Cache a result under a query embedding, evicting the least
+        recently used entry if full"""
+        if self.capacity <= 0:
+            return
+        if self._keys is None:
+            dimension = embedding.shape[0]
+            self._keys = np.zeros((self.capacity, dimension), dtype=np.float32)
+            rng = np.random.default_rng()
+            self._projections = [
+                rng.standard_normal((dimension, self._num_bits)).astype(np.float32)
+                for _ in range(self._num_tables)
+            ]
+        if not self._free:
+            self._release(next(iter(self._order)))
+
+        slot = self._free.pop()
+        bucket_ids = self._bucket_keys(embedding)
+        for buckets, bucket in zip(self._buckets, bucket_ids):
+            buckets.setdefault(bucket, set()).add(slot)
+        self._keys[slot] = embedding
+        self._values[slot] = value
+        self._stored_at[slot] = time.monotonic()
+        self._bucket_ids[slot] = bucket_ids
+        self._order[slot] = None
+
+    def _release(self, slot: int):
+        """Drop the entry held in a slot"""
+        for buckets, bucket in zip(self._buckets, self._bucket_ids[slot]):
+            members = buckets[bucket]
+            members.discard(slot)
+            if not members:
+                del buckets[bucket]
+        self._values[slot] = None
+        self._bucket_ids[slot] = None
+        del self._order[slot]
+        self._free.append(slot)
+
+    def clear(self):
+        """Drop all cached results"""
+        for slot in list(self._order):
+            self._release(slot)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and lookup counters of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._order),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._order)
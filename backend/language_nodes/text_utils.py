@@ -0,0 +1,236 @@
+"""
+Text Utilities
+Shared text matching helpers for language-specific federated nodes
+"""
+
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Opt-in Hyperscan engine for keyword automata (KEYWORD_ENGINE=hyperscan).
+# It only outscans pyahocorasick on texts far longer than typical queries.
+USE_HYPERSCAN = HYPERSCAN_AVAILABLE and os.getenv("KEYWORD_ENGINE", "").lower() == "hyperscan"
+
+# Unicode blocks of the supported native scripts
+DEVANAGARI_RANGE = (0x0900, 0x097F)
+TELUGU_RANGE = (0x0C00, 0x0C7F)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed keyword vocabulary.
+
+    Keywords are registered with a payload, the automaton is built once, and
+    every occurrence of every keyword in a text is then found in a single
+    linear scan. Uses pyahocorasick when installed and a pure-Python
+    automaton otherwise, or a Hyperscan literal database when opted in.
+    """
+
+    def __init__(self):
+        self._payloads: Dict[str, List[Any]] = {}
+        self._automaton = None
+
+    def add(self, keyword: str, payload: Any):
+        """Register a keyword; a keyword may carry several payloads"""
+        if keyword:
+            self._payloads.setdefault(keyword, []).append(payload)
+            self._automaton = None
+
+    def build(self):
+        """Compile the registered keywords into the automaton"""
+        if USE_HYPERSCAN:
+            self._automaton = _HyperscanAutomaton(self._payloads)
+        elif AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword, payloads in self._payloads.items():
+                automaton.add_word(keyword, tuple(payloads))
+            if self._payloads:
+                automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._automaton = _PyAutomaton(self._payloads)
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Any]:
+        """Yield the payloads of every keyword occurrence in text"""
+        if self._automaton is None:
+            self.build()
+        if not self._payloads:
+            return
+        if AHOCORASICK_AVAILABLE and not USE_HYPERSCAN:
+            for _, payloads in self._automaton.iter(text):
+                yield from payloads
+        else:
+            yield from self._automaton.iter(text)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+class _HyperscanAutomaton:
+    """Hyperscan literal database scanning UTF-8 bytes for every keyword"""
+
+    def __init__(self, payloads: Dict[str, List[Any]]):
+        self._payloads = [tuple(keyword_payloads) for keyword_payloads in payloads.values()]
+        self._database = None
+        if payloads:
+            self._database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self._database.compile(
+                expressions=[keyword.encode("utf-8") for keyword in payloads],
+                ids=list(range(len(payloads))),
+                literal=True
+            )
+
+    def iter(self, text: str) -> Iterator[Any]:
+        matches = []
+        self._database.scan(
+            text.encode("utf-8"),
+            match_event_handler=lambda keyword_id, start, end, flags, context: matches.append(keyword_id)
+        )
+        payloads = self._payloads
+        for keyword_id in matches:
+            yield from payloads[keyword_id]
+
+
+class _PyAutomaton:
+    """Pure-Python Aho-Corasick automaton used when pyahocorasick is missing"""
+
+    def __init__(self, payloads: Dict[str, List[Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Any]] = [[]]
+
+        # Build the keyword trie
+        for keyword, keyword_payloads in payloads.items():
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].extend(keyword_payloads)
+
+        # Breadth-first pass to set failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter(self, text: str) -> Iterator[Any]:
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield from output[state]
+
+
+def count_script_chars(text: str, script_range: Tuple[int, int] = DEVANAGARI_RANGE) -> Tuple[int, int, int]:
+    """
+    Count native-script, Roman (ASCII letter) and non-space characters of
+    text in a single pass over its codepoints.
+
+    Returns a (script_chars, roman_chars, non_space_chars) tuple.
+    """
+    low, high = script_range
+    if NUMBA_AVAILABLE:
+        # The kernel decodes UTF-8 itself; passing bytes skips building an array
+        script_chars, roman_chars, non_space_chars = _count_script_chars_kernel(text.encode("utf-8"), low, high)
+        return int(script_chars), int(roman_chars), int(non_space_chars)
+        
+    if NUMPY_AVAILABLE:
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        script_chars = int(((codepoints >= low) & (codepoints <= high)).sum())
+        roman_chars = int((((codepoints >= 0x41) & (codepoints <= 0x5A)) |
+                           ((codepoints >= 0x61) & (codepoints <= 0x7A))).sum())
+        non_space_chars = int((codepoints != 0x20).sum())
+        return script_chars, roman_chars, non_space_chars
+        
+    script_chars = roman_chars = 0
+    for match in _script_regex(low, high).finditer(text):
+        if match.lastgroup == "script":
+            script_chars += match.end() - match.start()
+        else:
+            roman_chars += match.end() - match.start()
+    return script_chars, roman_chars, len(text) - text.count(" ")
+
+
+@lru_cache(maxsize=None)
+def _script_regex(low: int, high: int):
+    """Single alternation matching native-script and Roman runs"""
+    return re.compile(f"(?P<script>[{chr(low)}-{chr(high)}]+)|(?P<roman>[a-zA-Z]+)")
+
+
+def warm_up_text_kernels():
+    """Compile the JIT text kernels ahead of the first query"""
+    if NUMBA_AVAILABLE:
+        count_script_chars("a")
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, nogil=True)
+    def _count_script_chars_kernel(data, low, high):
+        script_chars = roman_chars = non_space_chars = 0
+        size = len(data)
+        i = 0
+        while i < size:
+            # Decode one codepoint from its UTF-8 lead and continuation bytes
+            lead = data[i]
+            if lead < 0x80:
+                code = lead
+                i += 1
+            elif lead < 0xE0:
+                code = ((lead & 0x1F) << 6) | (data[i + 1] & 0x3F)
+                i += 2
+            elif lead < 0xF0:
+                code = ((lead & 0x0F) << 12) | ((data[i + 1] & 0x3F) << 6) | (data[i + 2] & 0x3F)
+                i += 3
+            else:
+                code = (((lead & 0x07) << 18) | ((data[i + 1] & 0x3F) << 12) |
+                        ((data[i + 2] & 0x3F) << 6) | (data[i + 3] & 0x3F))
+                i += 4
+            if code != 0x20:
+                non_space_chars += 1
+                if low <= code <= high:
+                    script_chars += 1
+                elif (0x41 <= code <= 0x5A) or (0x61 <= code <= 0x7A):
+                    roman_chars += 1
+        return script_chars, roman_chars, non_space_chars
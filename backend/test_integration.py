@@ -40,7 +40,7 @@ async def test_real_world_integration():
             print(f"\n🔍 Testing query: {query}")
             
             try:
-                results = google_cse.search_with_language_context(query, "hindi", 2)
+                results = await google_cse.async_search_with_language_context(query, "hindi", 2)
                 
                 if results:
                     print(f"   ✅ Found {len(results)} results")
@@ -6,10 +6,24 @@ Tests the complete flow from API gateway to Google Custom Search API
 import asyncio
 import json
 import logging
-import requests
+import os
 import time
 from typing import Dict, Any
 
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import rloop
+    RLOOP_AVAILABLE = True
+except ImportError:
+    RLOOP_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,7 +67,7 @@ class IntegrationTester:
             test_query = "दिवाली की सफाई"
             logger.info(f"Testing query: {test_query}")
             
-            real_world_data = aggregator.get_real_world_context(test_query, "hindi", {})
+            real_world_data = await aggregator.async_get_real_world_context(test_query, "hindi", {})
             
             # Validate results
             search_results = real_world_data.get('search_results', [])
@@ -108,13 +122,21 @@ class IntegrationTester:
             
             from api.main import actual_node_processing
             
-            # Test all languages
-            for language, queries in self.test_queries.items():
-                test_query = queries[0]
-                logger.info(f"Testing {language}: {test_query}")
-                
-                result = await actual_node_processing(language, test_query, {})
+            # Test all languages concurrently
+            languages = list(self.test_queries)
+            for language in languages:
+                logger.info(f"Testing {language}: {self.test_queries[language][0]}")
                 
+            results = await asyncio.gather(
+                *(actual_node_processing(language, self.test_queries[language][0], {})
+                  for language in languages),
+                return_exceptions=True
+            )
+            
+            for language, result in zip(languages, results):
+                if isinstance(result, Exception):
+                    raise result
+                    
                 logger.info(f"✅ {language} response type: {result.get('response', {}).get('type', 'unknown')}")
                 has_real_data = len(result.get('real_world_data', {}).get('search_results', [])) > 0
                 logger.info(f"🔍 {language} has real data: {has_real_data}")
@@ -125,34 +147,44 @@ class IntegrationTester:
             logger.error(f"❌ API gateway direct test failed: {e}")
             return False
             
-    def test_api_endpoints(self):
+    async def test_api_endpoints(self):
         """Test API endpoints via HTTP requests"""
         logger.info("🧪 Testing API endpoints...")
         
         try:
+            # One pooled client; the health probe and every language query
+            # are sent concurrently over its kept-alive connections
+            async with httpx.AsyncClient(
+                base_url=self.api_base_url,
+                http2=HTTP2_AVAILABLE,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+            ) as client:
+                languages = list(self.test_queries)
+                health, *outcomes = await asyncio.gather(
+                    client.get("/health", timeout=10),
+                    *(client.post("/api/v1/query", json={
+                        "query": self.test_queries[language][0],
+                        "language": language
+                    }) for language in languages),
+                    return_exceptions=True
+                )
+                
             # Test health endpoint
-            response = requests.get(f"{self.api_base_url}/health", timeout=10)
-            if response.status_code == 200:
+            if isinstance(health, httpx.ConnectError):
+                raise health
+            if isinstance(health, Exception):
+                logger.warning(f"⚠️ Health endpoint failed: {health}")
+            elif health.status_code == 200:
                 logger.info("✅ Health endpoint working")
             else:
-                logger.warning(f"⚠️ Health endpoint returned {response.status_code}")
+                logger.warning(f"⚠️ Health endpoint returned {health.status_code}")
                 
             # Test query endpoint
-            for language, queries in self.test_queries.items():
-                test_query = queries[0]
-                
-                payload = {
-                    "query": test_query,
-                    "language": language
-                }
-                
-                response = requests.post(
-                    f"{self.api_base_url}/api/v1/query",
-                    json=payload,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
+            for language, response in zip(languages, outcomes):
+                if isinstance(response, Exception):
+                    logger.error(f"❌ {language} API call failed: {response}")
+                elif response.status_code == 200:
                     result = response.json()
                     logger.info(f"✅ {language} API call successful")
                     logger.info(f"🔍 Response type: {result.get('response', {}).get('response', {}).get('type', 'unknown')}")
@@ -161,7 +193,7 @@ class IntegrationTester:
                     
             return True
             
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             logger.warning("⚠️ API server not running - skipping HTTP tests")
             return False
         except Exception as e:
@@ -178,17 +210,17 @@ class IntegrationTester:
             google_cse = GoogleCSEIntegration()
             aggregator = RealWorldDataAggregator(google_cse)
             
-            # Test response times
+            # Test response times, all queries in flight at once
             test_queries = ["दिवाली", "ఉగాది", "गणेश"]
             
-            for query in test_queries:
-                start_time = time.time()
-                
-                real_world_data = aggregator.get_real_world_context(query, "hindi", {})
-                
-                end_time = time.time()
-                response_time = (end_time - start_time) * 1000
+            async def timed_query(query):
+                start_time = time.perf_counter()
+                await aggregator.async_get_real_world_context(query, "hindi", {})
+                return (time.perf_counter() - start_time) * 1000
                 
+            response_times = await asyncio.gather(*(timed_query(query) for query in test_queries))
+            
+            for query, response_time in zip(test_queries, response_times):
                 logger.info(f"⏱️ Query '{query}': {response_time:.2f}ms")
                 
                 if response_time > 5000:  # 5 seconds
@@ -206,20 +238,22 @@ class IntegrationTester:
         
         test_results = {}
         
-        # Test 1: Direct real-world data access
-        test_results["direct_real_world"] = await self.test_direct_real_world_data()
-        
-        # Test 2: Language nodes
-        test_results["language_nodes"] = await self.test_language_nodes()
-        
-        # Test 3: API gateway direct
-        test_results["api_gateway_direct"] = await self.test_api_gateway_direct()
+        # Tests 1-3 share no state, so run them concurrently:
+        # direct real-world data access, language nodes and API gateway direct
+        concurrent_tests = {
+            "direct_real_world": self.test_direct_real_world_data(),
+            "language_nodes": self.test_language_nodes(),
+            "api_gateway_direct": self.test_api_gateway_direct()
+        }
+        results = await asyncio.gather(*concurrent_tests.values())
+        test_results.update(zip(concurrent_tests, results))
         
-        # Test 4: Performance
+        # Test 4: Performance, run on its own so its timings are not skewed
+        # by the concurrent tests competing for CPU and the shared aggregator
         test_results["performance"] = await self.test_performance()
         
         # Test 5: API endpoints (if server is running)
-        test_results["api_endpoints"] = self.test_api_endpoints()
+        test_results["api_endpoints"] = await self.test_api_endpoints()
         
         # Summary
         logger.info("\n" + "="*50)
@@ -251,4 +285,7 @@ async def main():
     return results
 
 if __name__ == "__main__":
+    # Opt-in alternative event loop, e.g. TEST_EVENT_LOOP=rloop
+    if os.getenv("TEST_EVENT_LOOP", "").lower() == "rloop" and RLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
     asyncio.run(main())
@@ -6,14 +6,30 @@ import pytest
 import asyncio
 from backend.language_nodes.hindi_node import HindiNode
 
-@pytest.fixture
-async def hindi_node():
-    """Create a Hindi node instance for testing"""
+@pytest.fixture(scope="module")
+def event_loop():
+    """Run every test in the module on one loop, shared with the module node"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="module")
+async def initialized_hindi_node():
+    """Create and initialize one Hindi node shared by the module's tests"""
     config = {"test_mode": True}
     node = HindiNode(config)
     await node.initialize()
     return node
 
+@pytest.fixture
+async def hindi_node(initialized_hindi_node):
+    """Hand each test the shared Hindi node with per-query state reset"""
+    node = initialized_hindi_node
+    await node._setup_local_storage()
+    node.response_cache.hits = node.response_cache.misses = 0
+    node._initialize_metrics()
+    return node
+
 @pytest.mark.asyncio
 async def test_hindi_node_initialization(hindi_node):
     """Test Hindi node initialization"""
@@ -64,7 +80,7 @@ async def test_cultural_context_detection(hindi_node):
     """Test cultural context detection"""
     query = "होली के रंग कैसे बनाएं?"
     
-    cultural_context = await hindi_node._detect_cultural_context(query)
+    cultural_context = hindi_node._detect_cultural_context(query)
     
     assert len(cultural_context["festivals"]) > 0
     assert any(f["name"] == "होली" for f in cultural_context["festivals"])
@@ -80,7 +96,7 @@ async def test_intent_classification(hindi_node):
     ]
     
     for query, expected_intent in test_cases:
-        intent = await hindi_node._classify_intent(query)
+        intent = hindi_node._classify_intent(query)
         assert intent == expected_intent
 
 @pytest.mark.asyncio
@@ -103,13 +119,42 @@ async def test_performance_metrics(hindi_node):
         "बुखार का घरेलू इलाज"
     ]
     
-    for query in queries:
-        await hindi_node.process_query(query)
+    results = await hindi_node.process_queries(queries)
+    assert len(results) == len(queries)
     
     metrics = hindi_node.performance_metrics
     assert metrics["total_queries"] == len(queries)
     assert metrics["successful_queries"] == len(queries)
     assert metrics["average_response_time"] > 0
 
+@pytest.mark.asyncio
+async def test_repeated_query_served_from_cache(hindi_node):
+    """Test that repeated queries are answered from the result cache"""
+    query = "होली के रंग कैसे बनाएं?"
+    
+    first = await hindi_node.process_query(query)
+    second = await hindi_node.process_query(query)
+    
+    assert len(hindi_node.response_cache) == 1
+    assert hindi_node.response_cache.hits == 1
+    assert hindi_node.response_cache.misses == 1
+    assert second["cultural_context"] == first["cultural_context"]
+    assert second["intent"] == first["intent"]
+
+@pytest.mark.asyncio
+async def test_cache_hit_quotes_callers_query(hindi_node):
+    """Test that a cache hit's response is built from the caller's own query"""
+    first = await hindi_node.process_query("Diwali")
+    second = await hindi_node.process_query("diwali ")
+    
+    assert hindi_node.response_cache.hits == 1
+    assert "'Diwali'" in first["response"]["cultural_introduction"]
+    assert "'diwali '" in second["response"]["cultural_introduction"]
+    
+    # Results are copies, so mutating one cannot corrupt the cache
+    second["cultural_context"]["festivals"].clear()
+    third = await hindi_node.process_query("DIWALI")
+    assert third["cultural_context"]["festivals"]
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -6,7 +6,7 @@ echo 🚀 Setting up GlobalMind FL Development Environment...
 REM Check if Python is installed
 python --version >nul 2>&1
 if %errorlevel% neq 0 (
-    echo ❌ Python 3.8+ is required but not found. Please install Python 3.8 or higher.
+    echo ❌ Python 3.10+ is required but not found. Please install Python 3.10 or higher.
     pause
     exit /b 1
 ) else (
@@ -22,10 +22,10 @@ print_error() {
     echo -e "${RED}[ERROR]${NC} $1"
 }
 
-# Check if Python 3.8+ is installed
+# Check if Python 3.10+ is installed
 python_version=$(python3 --version 2>&1 | awk '{print $2}')
 if [[ -z "$python_version" ]]; then
-    print_error "Python 3.8+ is required but not found. Please install Python 3.8 or higher."
+    print_error "Python 3.10+ is required but not found. Please install Python 3.10 or higher."
     exit 1
 else
     print_status "Found Python $python_version"
@@ -1,9 +1,31 @@
 import streamlit as st
 import requests
+import asyncio
+import multiprocessing
+import httpx
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
-from newspaper import Article
 from urllib.parse import urlparse
-import time
+
+from article_extraction import extract_article_text
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Search responses are kept for an hour so Streamlit reruns don't spend
+# API quota; the API key is left out of the cache key and stored responses
+if REQUESTS_CACHE_AVAILABLE:
+    SESSION = requests_cache.CachedSession(
+        "cse_cache", backend="sqlite", expire_after=3600, ignored_parameters=["key"]
+    )
+else:
+    SESSION = requests.Session()
+
+# Articles downloaded at once while extracting search results
+MAX_CONCURRENT_FETCHES = 4
 
  # Your provided cx
 
@@ -31,13 +53,63 @@ def google_search(query, api_key, cse_id, num_results=5):
     st.write("Search Parameters Preview:")
     st.json(params)
 
-    response = requests.get(url, params=params)
+    response = SESSION.get(url, params=params)
     if response.status_code == 200:
         return response.json().get("items", [])
     else:
         st.error("Google Search API Error: " + response.text)
         return []
 
+@st.cache_resource
+def parse_pool():
+    # Article parsing is CPU-bound, so it runs in worker processes kept
+    # across reruns. The Streamlit server is multithreaded and forking it
+    # can deadlock, so workers are started from a fresh forkserver or
+    # spawned process and import the parser from article_extraction.
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context(method))
+
+class IncompleteExtraction(Exception):
+    # Raised out of the cached extraction when any article failed, so the
+    # batch is not cached and failed URLs are retried on the next rerun
+    def __init__(self, articles):
+        super().__init__("Some articles could not be extracted")
+        self.articles = articles
+
+async def fetch_article(client, semaphore, pool, url):
+    # The semaphore bounds parallel downloads to be nice to the servers
+    async with semaphore:
+        response = await client.get(url)
+        response.raise_for_status()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, extract_article_text, url, response.text)
+
+async def fetch_articles(urls):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    pool = parse_pool()
+    async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        return await asyncio.gather(
+            *(fetch_article(client, semaphore, pool, url) for url in urls), return_exceptions=True
+        )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_articles(urls):
+    # Reruns for the same results reuse the extracted articles
+    results = asyncio.run(fetch_articles(urls))
+    articles = [
+        ("", f"Failed to extract content: {result}") if isinstance(result, Exception) else result
+        for result in results
+    ]
+    if any(isinstance(result, Exception) for result in results):
+        raise IncompleteExtraction(articles)
+    return articles
+
+def extract_articles(urls):
+    try:
+        return cached_articles(urls)
+    except IncompleteExtraction as e:
+        return e.articles
 
 
 # 🖼️ Streamlit UI
@@ -53,7 +125,10 @@ if st.button("Search and Extract"):
 
 
         if results:
-            for item in results:
+            with st.spinner("Extracting content..."):
+                articles = extract_articles(tuple(item.get("link") for item in results))
+
+            for item, (article_title, article_text) in zip(results, articles):
                 title = item.get("title")
                 link = item.get("link")
 
@@ -64,11 +139,8 @@ if st.button("Search and Extract"):
 
                 st.markdown(f"### [{title}]({link})")
 
-                with st.spinner("Extracting content..."):
-                    time.sleep(1)  # be nice to the server
-                    article_title, article_text = extract_article_text(link)
-                    st.markdown(f"**Extracted Title:** {article_title}")
-                    st.markdown(f"**Content Preview:**\n\n{article_text[:1000]}...")
+                st.markdown(f"**Extracted Title:** {article_title}")
+                st.markdown(f"**Content Preview:**\n\n{article_text[:1000]}...")
 
                 st.markdown("---")
 